@@ -43,26 +43,42 @@ fn run_command(program: &str, args: Vec<String>) -> PyResult<String> {
 // Hyprland IPC
 // ============================================================================
 
+/// Resolve the Hyprland IPC socket path once per process.
+///
+/// Hyprland closes the connection after every request, so a persistent
+/// session is not possible; caching the env-var lookup and existence
+/// probe is the part of the per-call setup that can be amortized.
+fn hyprland_socket_path() -> PyResult<&'static str> {
+    static SOCKET_PATH: std::sync::OnceLock<Result<String, String>> = std::sync::OnceLock::new();
+
+    let resolved = SOCKET_PATH.get_or_init(|| {
+        let his = std::env::var("HYPRLAND_INSTANCE_SIGNATURE")
+            .map_err(|_| "HYPRLAND_INSTANCE_SIGNATURE not set".to_string())?;
+
+        // Try XDG_RUNTIME_DIR first (Hyprland 0.40+), fallback to /tmp
+        if let Ok(xdg) = std::env::var("XDG_RUNTIME_DIR") {
+            let xdg_path = format!("{}/hypr/{}/.socket.sock", xdg, his);
+            if std::path::Path::new(&xdg_path).exists() {
+                return Ok(xdg_path);
+            }
+        }
+        Ok(format!("/tmp/hypr/{}/.socket.sock", his))
+    });
+
+    match resolved {
+        Ok(path) => Ok(path.as_str()),
+        Err(msg) => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            msg.clone(),
+        )),
+    }
+}
+
 /// Query Hyprland IPC directly via Unix socket.
 #[pyfunction]
 fn hyprctl(command: &str) -> PyResult<String> {
-    let his = std::env::var("HYPRLAND_INSTANCE_SIGNATURE").map_err(|_| {
-        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("HYPRLAND_INSTANCE_SIGNATURE not set")
-    })?;
+    let socket_path = hyprland_socket_path()?;
 
-    // Try XDG_RUNTIME_DIR first (Hyprland 0.40+), fallback to /tmp
-    let socket_path = if let Ok(xdg) = std::env::var("XDG_RUNTIME_DIR") {
-        let xdg_path = format!("{}/hypr/{}/.socket.sock", xdg, his);
-        if std::path::Path::new(&xdg_path).exists() {
-            xdg_path
-        } else {
-            format!("/tmp/hypr/{}/.socket.sock", his)
-        }
-    } else {
-        format!("/tmp/hypr/{}/.socket.sock", his)
-    };
-
-    let mut stream = UnixStream::connect(&socket_path).map_err(|e| {
+    let mut stream = UnixStream::connect(socket_path).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyConnectionError, _>(format!(
             "Failed to connect to Hyprland socket: {}",
             e
@@ -87,6 +103,116 @@ fn hyprctl_json(command: &str) -> PyResult<String> {
     hyprctl(&format!("j/{}", command))
 }
 
+/// Convert a parsed serde_json value into native Python objects.
+fn json_to_py(py: Python<'_>, value: &serde_json::Value) -> PyResult<PyObject> {
+    use pyo3::types::PyList;
+    use pyo3::IntoPyObjectExt;
+
+    match value {
+        serde_json::Value::Null => Ok(py.None()),
+        serde_json::Value::Bool(b) => b.into_py_any(py),
+        serde_json::Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.into_py_any(py)
+            } else if let Some(u) = n.as_u64() {
+                u.into_py_any(py)
+            } else {
+                n.as_f64().unwrap_or(f64::NAN).into_py_any(py)
+            }
+        }
+        serde_json::Value::String(s) => s.into_py_any(py),
+        serde_json::Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_to_py(py, item)?)?;
+            }
+            list.into_py_any(py)
+        }
+        serde_json::Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (k, v) in map {
+                dict.set_item(k, json_to_py(py, v)?)?;
+            }
+            dict.into_py_any(py)
+        }
+    }
+}
+
+/// Query Hyprland IPC and return the reply as parsed Python objects.
+/// Parsing happens once in serde_json; Python never re-scans the bytes.
+#[pyfunction]
+fn hyprctl_json_parsed(py: Python<'_>, command: &str) -> PyResult<PyObject> {
+    let reply = hyprctl_json(command)?;
+    let value: serde_json::Value = serde_json::from_str(&reply).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Invalid JSON from hyprctl: {}",
+            e
+        ))
+    })?;
+    json_to_py(py, &value)
+}
+
+/// Split a concatenated-JSON reply into individual document strings.
+/// Hyprland batch replies glue the per-command JSON outputs together.
+fn split_json_documents(reply: &str) -> Vec<String> {
+    let mut docs = Vec::new();
+    let mut depth = 0usize;
+    let mut start: Option<usize> = None;
+    let mut in_string = false;
+    let mut escaped = false;
+
+    for (i, c) in reply.char_indices() {
+        if in_string {
+            if escaped {
+                escaped = false;
+            } else if c == '\\' {
+                escaped = true;
+            } else if c == '"' {
+                in_string = false;
+            }
+            continue;
+        }
+        match c {
+            '"' => in_string = true,
+            '{' | '[' => {
+                if depth == 0 {
+                    start = Some(i);
+                }
+                depth += 1;
+            }
+            '}' | ']' => {
+                depth = depth.saturating_sub(1);
+                if depth == 0 {
+                    if let Some(s) = start.take() {
+                        docs.push(reply[s..=i].to_string());
+                    }
+                }
+            }
+            _ => {}
+        }
+    }
+    docs
+}
+
+/// Query multiple Hyprland IPC commands in a single socket round-trip.
+/// Uses Hyprland's [[BATCH]] protocol; returns one JSON string per command.
+#[pyfunction]
+#[pyo3(signature = (*commands))]
+fn hyprctl_json_batch(commands: Vec<String>) -> PyResult<Vec<String>> {
+    let joined: Vec<String> = commands.iter().map(|c| format!("j/{}", c)).collect();
+    let reply = hyprctl(&format!("[[BATCH]]{}", joined.join(";")))?;
+
+    let docs = split_json_documents(&reply);
+    if docs.len() != commands.len() {
+        return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+            "Batch reply had {} JSON documents, expected {}",
+            docs.len(),
+            commands.len()
+        )));
+    }
+    Ok(docs)
+}
+
 // ============================================================================
 // Matugen color caching
 // ============================================================================
@@ -378,9 +504,10 @@ fn memory_info() -> PyResult<(u64, u64, u64)> {
     Ok((total, used, available))
 }
 
-/// Get CPU usage as percentage (0.0 - 100.0)
+/// Get CPU usage as percentage (0.0 - 100.0) with a synchronous
+/// 100ms sampling window.
 #[pyfunction]
-fn cpu_usage() -> PyResult<f32> {
+fn cpu_usage_sync() -> PyResult<f32> {
     use sysinfo::System;
     let mut sys = System::new();
     sys.refresh_cpu_usage();
@@ -391,6 +518,40 @@ fn cpu_usage() -> PyResult<f32> {
     Ok(usage)
 }
 
+/// Cached CPU usage refreshed by a background sampler thread.
+///
+/// The first call blocks for one ~100ms sampling window and spawns a
+/// thread that keeps a fresh delta sample in an atomic; every later
+/// call is a load and returns in well under a microsecond, so the
+/// result is always a real measurement, never a placeholder.
+#[pyfunction]
+fn cpu_usage() -> PyResult<f32> {
+    use std::sync::atomic::{AtomicU32, Ordering};
+
+    static LATEST: AtomicU32 = AtomicU32::new(0);
+    static SAMPLER: std::sync::Once = std::sync::Once::new();
+
+    fn sample(sys: &mut sysinfo::System) -> f32 {
+        sys.refresh_cpu_usage();
+        std::thread::sleep(std::time::Duration::from_millis(100));
+        sys.refresh_cpu_usage();
+        sys.cpus().iter().map(|c| c.cpu_usage()).sum::<f32>() / sys.cpus().len().max(1) as f32
+    }
+
+    SAMPLER.call_once(|| {
+        // Take the first sample inline so this call — and any that
+        // raced it through the Once — returns measured data
+        let mut sys = sysinfo::System::new();
+        LATEST.store(sample(&mut sys).to_bits(), Ordering::Relaxed);
+        std::thread::spawn(move || loop {
+            std::thread::sleep(std::time::Duration::from_millis(400));
+            LATEST.store(sample(&mut sys).to_bits(), Ordering::Relaxed);
+        });
+    });
+
+    Ok(f32::from_bits(LATEST.load(Ordering::Relaxed)))
+}
+
 // ============================================================================
 // Python module
 // ============================================================================
@@ -403,6 +564,8 @@ fn wrp_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Hyprland
     m.add_function(wrap_pyfunction!(hyprctl, m)?)?;
     m.add_function(wrap_pyfunction!(hyprctl_json, m)?)?;
+    m.add_function(wrap_pyfunction!(hyprctl_json_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(hyprctl_json_parsed, m)?)?;
 
     // Colors
     m.add_function(wrap_pyfunction!(get_cached_colors, m)?)?;
@@ -416,6 +579,7 @@ fn wrp_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // System info
     m.add_function(wrap_pyfunction!(memory_info, m)?)?;
     m.add_function(wrap_pyfunction!(cpu_usage, m)?)?;
+    m.add_function(wrap_pyfunction!(cpu_usage_sync, m)?)?;
 
     Ok(())
 }
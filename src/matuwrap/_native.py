@@ -0,0 +1,33 @@
+"""Single probe for the compiled wrp_native extension.
+
+Several modules used to re-attempt ``from matuwrap.wrp_native import
+...`` at their own top level; on installs without the extension each
+attempt pays a full import-system miss. The try/except here runs once —
+after that, every ``from matuwrap._native import ...`` is a cached
+module-dict lookup. All symbols are None when the extension is absent.
+"""
+
+HAVE_NATIVE = False
+hyprctl = None
+hyprctl_json = None
+hyprctl_json_batch = None
+hyprctl_json_parsed = None
+get_audio_sinks = None
+set_default_sink = None
+get_cached_colors = None
+AudioSink = None
+
+try:
+    from matuwrap import wrp_native as _n
+
+    hyprctl = _n.hyprctl
+    hyprctl_json = _n.hyprctl_json
+    hyprctl_json_batch = _n.hyprctl_json_batch
+    hyprctl_json_parsed = _n.hyprctl_json_parsed
+    get_audio_sinks = _n.get_audio_sinks
+    set_default_sink = _n.set_default_sink
+    get_cached_colors = _n.get_cached_colors
+    AudioSink = _n.AudioSink
+    HAVE_NATIVE = True
+except (ImportError, AttributeError):
+    pass
@@ -6,16 +6,16 @@ import re
 from typing import TYPE_CHECKING
 
 from matuwrap.core.notify import notify
-from matuwrap.core.theme import console, print_header, print_success, print_error, fmt
+from matuwrap.core.theme import emit, print_success, print_error, fmt
 
-# Try native implementation
-try:
-    from matuwrap.wrp_native import get_audio_sinks, set_default_sink, AudioSink
-    _USE_NATIVE = True
-except ImportError:
-    _USE_NATIVE = False
-    get_audio_sinks = None  # type: ignore[assignment]
-    set_default_sink = None  # type: ignore[assignment]
+# Shared native probe — one import attempt per process. AudioSink is
+# only needed for annotations, which stay lazy under
+# `from __future__ import annotations`, so no runtime binding
+from matuwrap._native import (
+    HAVE_NATIVE as _USE_NATIVE,
+    get_audio_sinks,
+    set_default_sink,
+)
 
 if TYPE_CHECKING:
     from matuwrap.wrp_native import AudioSink
@@ -28,26 +28,38 @@ COMMAND = {
 }
 
 
-def _find_sink(sinks: list[AudioSink], pattern: str) -> AudioSink | None:
-    """Find sink matching pattern."""
-    for sink in sinks:
-        if re.search(pattern, sink.name, re.IGNORECASE):
-            return sink
-    return None
+# Compiled once; callers passing their own pattern strings get them
+# compiled on the spot
+_HDMI_RE = re.compile(r"HDMI|AD103", re.IGNORECASE)
+_HEADSET_RE = re.compile(r"HyperX|Headset", re.IGNORECASE)
 
 
 def _toggle(
-    hdmi_pattern: str = r"HDMI|AD103",
-    headset_pattern: str = r"HyperX|Headset",
+    hdmi_pattern: re.Pattern | str = _HDMI_RE,
+    headset_pattern: re.Pattern | str = _HEADSET_RE,
 ) -> int:
     """Toggle between HDMI and headset audio sinks."""
     if not _USE_NATIVE or get_audio_sinks is None or set_default_sink is None:
         print_error("Native module not available")
         return 1
 
+    if isinstance(hdmi_pattern, str):
+        hdmi_pattern = re.compile(hdmi_pattern, re.IGNORECASE)
+    if isinstance(headset_pattern, str):
+        headset_pattern = re.compile(headset_pattern, re.IGNORECASE)
+
+    # One pass finds both sinks, with early exit once they're matched
     sinks = get_audio_sinks()
-    hdmi = _find_sink(sinks, hdmi_pattern)
-    headset = _find_sink(sinks, headset_pattern)
+    hdmi: AudioSink | None = None
+    headset: AudioSink | None = None
+    for sink in sinks:
+        name = sink.name
+        if hdmi is None and hdmi_pattern.search(name):
+            hdmi = sink
+        elif headset is None and headset_pattern.search(name):
+            headset = sink
+        if hdmi is not None and headset is not None:
+            break
 
     if not hdmi or not headset:
         missing = []
@@ -85,8 +97,10 @@ def _show() -> int:
         return 1
 
     sinks = get_audio_sinks()
-    print_header("Audio Sinks")
 
+    # One buffered print for the whole listing — a markup parse and
+    # stdout write per sink is the expensive part of this command
+    lines = ["\n[title]Audio Sinks[/title]"]
     for sink in sinks:
         if sink.is_default:
             indicator = "[bool_on]●[/bool_on]"
@@ -96,9 +110,9 @@ def _show() -> int:
             id_fmt = fmt(sink.id)
 
         vol_str = f" [muted]vol:[/muted] {fmt(sink.volume)}" if sink.volume is not None else ""
-        console.print(f"  {indicator} {id_fmt}[muted].[/muted] {fmt(sink.name)}{vol_str}")
+        lines.append(f"  {indicator} {id_fmt}[muted].[/muted] {fmt(sink.name)}{vol_str}")
 
-    console.print()
+    emit("\n".join(lines) + "\n")
     return 0
 
 
@@ -1,4 +1,6 @@
 """Matugen cached colors json command."""
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from matuwrap.wrp_native import get_cached_colors
@@ -12,9 +14,28 @@ COMMAND = {
 }
 
 WALLPAPER_PATH = Path.home() / ".current.wall"
+# Precomputed once: avoids a __fspath__ + str conversion per invocation
+WALLPAPER_PATH_STR = str(WALLPAPER_PATH)
+
+# Request-scoped cache: (mtime_ns, colors dict) so back-to-back calls within
+# one CLI invocation don't re-validate through wrp_native.
+_colors_cache: tuple[int, dict[str, str] | None] | None = None
+
+def _colors() -> dict[str, str] | None:
+    """Get cached colors, memoized against the wallpaper mtime."""
+    global _colors_cache
+    try:
+        mtime = os.stat(WALLPAPER_PATH_STR).st_mtime_ns
+    except OSError:
+        return None
+    if _colors_cache is not None and _colors_cache[0] == mtime:
+        return _colors_cache[1]
+    colors = get_cached_colors(WALLPAPER_PATH_STR)
+    _colors_cache = (mtime, colors)
+    return colors
 
 def primary():
-    colors = get_cached_colors(str(WALLPAPER_PATH))
+    colors = _colors()
     if not colors:
         return None
 
@@ -25,23 +46,23 @@ def primary():
     return hex_color
 
 def hex_to_ansi(hex_color: str) -> str:
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return f"\033[38;2;{r};{g};{b}m"
+    # Single int parse + bit-shifts instead of three sliced int() calls;
+    # branch on the leading '#' rather than always allocating via lstrip
+    v = int(hex_color[1:] if hex_color[0] == "#" else hex_color, 16)
+    return f"\033[38;2;{(v >> 16) & 0xFF};{(v >> 8) & 0xFF};{v & 0xFF}m"
 
+@lru_cache(maxsize=32)
 def _hex_to_ps1(hex_color: str) -> str:
-    """Convert hex color to bash PS1 color escape (literal, for bash to interpret)."""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return f"\\[\\033[38;2;{r};{g};{b}m\\]"
+    """Convert hex color to bash PS1 color escape (literal, for bash to interpret).
+
+    Cached: PS1 is regenerated every shell prompt with the same theme colors.
+    """
+    v = int(hex_color[1:] if hex_color[0] == "#" else hex_color, 16)
+    return f"\\[\\033[38;2;{(v >> 16) & 0xFF};{(v >> 8) & 0xFF};{v & 0xFF}m\\]"
 
 def ps1() -> str:
     """Output bash PS1 fragment: colored user@host:workdir."""
-    colors = get_cached_colors(str(WALLPAPER_PATH))
+    colors = _colors()
     reset = "\\[\\033[0m\\]"
 
     if not colors:
@@ -50,7 +71,9 @@ def ps1() -> str:
     parts = []
     primary = colors.get("primary")
     if primary:
-        parts.append(f"{_hex_to_ps1(primary)}\\u{reset}@{_hex_to_ps1(primary)}\\h{reset}")
+        # Compute the escape once; it's reused for both \u and \h
+        p = _hex_to_ps1(primary)
+        parts.append(f"{p}\\u{reset}@{p}\\h{reset}")
     else:
         parts.append("\\u@\\h")
 
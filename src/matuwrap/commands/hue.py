@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import log
 from pathlib import Path
-from typing import Any
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Any
 
-from matuwrap.core.colors import get_colors
+if TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+from matuwrap.core.colors import WALLPAPER_PATH, Colors, get_colors
 from matuwrap.core.notify import notify
 from matuwrap.core.theme import (
     console,
@@ -21,10 +26,67 @@ from matuwrap.core.theme import (
     fmt,
 )
 
-load_dotenv()
-HUE_BRIDGE_IP = os.environ.get("HUE_BRIDGE_IP")
-HUE_USERNAME = os.environ.get("HUE_USERNAME")
-HUE_LOGO = Path(__file__).resolve().parents[1] / 'assets' / 'img' / 'hue_logo_.png'
+HUE_BRIDGE_IP: str | None = None
+HUE_USERNAME: str | None = None
+_env_loaded = False
+HUE_LOGO = os.fspath(Path(__file__).resolve().parents[1] / 'assets' / 'img' / 'hue_logo_.png')
+
+
+def _import_requests() -> None:
+    """Publish requests lazily: urllib3 import costs ~50ms that every
+    non-hue CLI invocation would otherwise pay at module import."""
+    if "requests" not in globals():
+        import requests as _requests
+        from requests.adapters import HTTPAdapter as _HTTPAdapter, Retry as _Retry
+
+        globals().update(requests=_requests, HTTPAdapter=_HTTPAdapter, Retry=_Retry)
+
+
+def _load_config() -> None:
+    """Load .env and read bridge credentials on first use."""
+    global _env_loaded, HUE_BRIDGE_IP, HUE_USERNAME
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        HUE_BRIDGE_IP = os.environ.get("HUE_BRIDGE_IP")
+        HUE_USERNAME = os.environ.get("HUE_USERNAME")
+        _env_loaded = True
+
+# Tanner Helland mired-to-RGB approximation constants
+_TH_GREEN_LOG = 99.4708025861
+_TH_GREEN_OFF = 161.1195681661
+_TH_BLUE_LOG = 138.5177312231
+_TH_BLUE_OFF = 305.0447927307
+_TH_RED_POW = 329.698727446
+_TH_RED_EXP = -0.1332047592
+_TH_GREEN_POW = 288.1221695283
+_TH_GREEN_EXP = -0.0755148492
+
+
+def _compute_ct_rgb(ct: int) -> tuple[int, int, int]:
+    """Approximate mired color temperature to RGB (Tanner Helland)."""
+    kelvin = 1000000 / ct
+    temp = kelvin / 100.0
+    if temp <= 66:
+        r = 255
+        g = _TH_GREEN_LOG * log(temp) - _TH_GREEN_OFF
+        if temp <= 19:
+            b = 0
+        else:
+            b = _TH_BLUE_LOG * log(temp - 10) - _TH_BLUE_OFF
+    else:
+        r = _TH_RED_POW * pow(temp - 60, _TH_RED_EXP)
+        g = _TH_GREEN_POW * pow(temp - 60, _TH_GREEN_EXP)
+        b = 255
+    ri = 0 if r <= 0 else 255 if r >= 255 else int(r)
+    gi = 0 if g <= 0 else 255 if g >= 255 else int(g)
+    bi = 0 if b <= 0 else 255 if b >= 255 else int(b)
+    return ri, gi, bi
+
+
+# ct only takes 348 integer values: precompute the whole table at import
+_CT_TO_RGB = tuple(_compute_ct_rgb(ct) for ct in range(153, 501))
 
 COMMAND = {
     "description": "Control Philips Hue lights",
@@ -37,6 +99,8 @@ COMMAND = {
         ("color", "<id> <hue> [sat]", "Set color (hue: 0-65535, sat: 0-254)"),
         ("temp", "<id> <153-500>", "Set color temperature (153=warm, 500=cool)"),
         ("theme", "<id> [color]", "Set light to matugen theme color (default: primary)"),
+        ("theme-all", "[color]", "Set all lights to matugen theme color"),
+        ("off-all", "", "Turn all lights off"),
         ("gui", "", "Open graphical user interface"),
     ],
 }
@@ -47,30 +111,55 @@ class HueController:
     """Philips Hue Bridge API controller."""
 
     def __init__(self, bridge_ip: str, username: str) -> None:
+        _import_requests()
         self.bridge_ip = bridge_ip
         self.username = username
         self.base_url = f"http://{bridge_ip}/api/{username}"
+        # Shared session: keep-alive reuses the TCP connection to the bridge,
+        # with pooling and retry on transient bridge errors
+        self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+        # Last-seen /lights payload; per-light reads consume it instead of
+        # issuing another GET within the same invocation
+        self._lights_cache: dict[str, Any] | None = None
 
     def get_lights(self) -> dict[str, Any]:
         """Get all lights."""
-        resp = requests.get(f"{self.base_url}/lights", timeout=10)
+        resp = self.session.get(f"{self.base_url}/lights", timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        self._lights_cache = resp.json()
+        return self._lights_cache
 
     def get_light(self, light_id: int) -> dict[str, Any]:
-        resp = requests.get(f"{self.base_url}/lights/{light_id}", timeout=10)
+        resp = self.session.get(f"{self.base_url}/lights/{light_id}", timeout=10)
         resp.raise_for_status()
         return resp.json()
 
     def set_light_state(self, light_id: int, **kwargs: Any) -> list[dict[str, Any]]:
         url = f"{self.base_url}/lights/{light_id}/state"
-        resp = requests.put(url, json=kwargs, timeout=10)
+        resp = self.session.put(url, json=kwargs, timeout=10)
         resp.raise_for_status()
+        # Keep the /lights memo coherent with what we just told the
+        # bridge, so a toggle() right after a write acts on the new
+        # state instead of the pre-write snapshot
+        cached = (self._lights_cache or {}).get(str(light_id))
+        if cached is not None:
+            cached.setdefault("state", {}).update(kwargs)
         return resp.json()
 
-    def toggle(self, light_id: int) -> list[dict[str, Any]]:
-        light = self.get_light(light_id)
-        is_on = bool(light.get("state", {}).get("on", False))
+    def toggle(self, light_id: int, state: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Toggle a light, using cached/passed state to skip the GET roundtrip."""
+        if state is None:
+            cached = (self._lights_cache or {}).get(str(light_id))
+            state = cached.get("state", {}) if cached else self.get_light(light_id).get("state", {})
+        is_on = bool(state.get("on", False))
         return self.set_light_state(light_id, on=not is_on)
 
     def turn_on(self, light_id: int) -> list[dict[str, Any]]:
@@ -91,16 +180,68 @@ class HueController:
         """ct: 153-500 (warm to cool)"""
         return self.set_light_state(light_id, on=True, ct=ct)
 
+    def set_many(self, states: dict[int, dict[str, Any]]) -> dict[int, list[dict[str, Any]]]:
+        """Apply state changes to several lights concurrently.
+
+        Submits all PUTs in flight over the shared session instead of
+        serializing bridge roundtrips. Workers capped at 8 to stay under
+        the bridge's rate limit.
+        """
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                light_id: pool.submit(self.set_light_state, light_id, **state)
+                for light_id, state in states.items()
+            }
+            return {light_id: f.result() for light_id, f in futures.items()}
+
+
+@lru_cache(maxsize=1)
+def _colors_for_mtime(mtime_ns: int) -> Colors:
+    return get_colors()
+
+
+def _wall_mtime_ns() -> int:
+    try:
+        return os.stat(WALLPAPER_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _cached_colors() -> Colors:
+    """Theme colors memoized on wallpaper mtime.
+
+    Repeat theme calls within one process skip re-reading the palette.
+    """
+    return _colors_for_mtime(_wall_mtime_ns())
+
+
+@lru_cache(maxsize=8)
+def _theme_hsv(mtime_ns: int, color_name: str) -> tuple[int, int]:
+    """(hue, sat) for a theme color; the RGB->HSV math runs once per palette."""
+    return _hex_to_hue(getattr(_colors_for_mtime(mtime_ns), color_name))
+
+
+def clear_color_cache() -> None:
+    """Drop the memoized palette (e.g. after reload-colors)."""
+    _colors_for_mtime.cache_clear()
+    _theme_hsv.cache_clear()
+
+
+def _print_config_error() -> None:
+    """Print instructions for configuring the Hue bridge."""
+    print_error("Hue bridge not configured")
+    console.print(
+        f"  [muted]Set environment variables:[/muted]\n"
+        f"    {fmt('HUE_BRIDGE_IP')} [muted]- Bridge IP address[/muted]\n"
+        f"    {fmt('HUE_USERNAME')} [muted]- Bridge username/token[/muted]"
+    )
+
 
 def _check_config() -> bool:
     """Check if Hue configuration is available."""
+    _load_config()
     if not HUE_BRIDGE_IP or not HUE_USERNAME:
-        print_error("Hue bridge not configured")
-        console.print(
-            f"  [muted]Set environment variables:[/muted]\n"
-            f"    {fmt('HUE_BRIDGE_IP')} [muted]- Bridge IP address[/muted]\n"
-            f"    {fmt('HUE_USERNAME')} [muted]- Bridge username/token[/muted]"
-        )
+        _print_config_error()
         return False
     return True
 
@@ -138,38 +279,41 @@ def _hue_state_to_hex(state: dict[str, Any]) -> str | None:
                     g = val
                 else:
                     b = val
-            ri = max(0, min(255, int(r * 255)))
-            gi = max(0, min(255, int(g * 255)))
-            bi = max(0, min(255, int(b * 255)))
-            return f"#{ri:02x}{gi:02x}{bi:02x}"
+            # Branchless clamp + single packed format op
+            ri = 0 if r <= 0 else 255 if r >= 1 else int(r * 255)
+            gi = 0 if g <= 0 else 255 if g >= 1 else int(g * 255)
+            bi = 0 if b <= 0 else 255 if b >= 1 else int(b * 255)
+            return f"#{(ri << 16) | (gi << 8) | bi:06x}"
     if colormode == "hs" or (state.get("hue") is not None and state.get("sat") is not None):
         h = state.get("hue", 0) / 65535.0
         s = state.get("sat", 0) / 254.0
         v = state.get("bri", 254) / 254.0
-        import colorsys
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+        # Inline 6-sector HSV->RGB (colorsys.hsv_to_rgb is pure Python
+        # with extra call/tuple overhead in this per-light loop)
+        i = int(h * 6.0)
+        f = h * 6.0 - i
+        p = v * (1.0 - s)
+        q = v * (1.0 - f * s)
+        t = v * (1.0 - (1.0 - f) * s)
+        i %= 6
+        if i == 0:
+            r, g, b = v, t, p
+        elif i == 1:
+            r, g, b = q, v, p
+        elif i == 2:
+            r, g, b = p, v, t
+        elif i == 3:
+            r, g, b = p, q, v
+        elif i == 4:
+            r, g, b = t, p, v
+        else:
+            r, g, b = v, p, q
+        return f"#{(int(r * 255) << 16) | (int(g * 255) << 8) | int(b * 255):06x}"
     if colormode == "ct" or state.get("ct") is not None:
         ct = state.get("ct", 326)
-        # Approximate mired to RGB
-        kelvin = 1000000 / ct
-        # Tanner Helland algorithm
-        temp = kelvin / 100.0
-        if temp <= 66:
-            r = 255
-            g = 99.4708025861 * __import__("math").log(temp) - 161.1195681661
-            if temp <= 19:
-                b = 0
-            else:
-                b = 138.5177312231 * __import__("math").log(temp - 10) - 305.0447927307
-        else:
-            r = 329.698727446 * pow(temp - 60, -0.1332047592)
-            g = 288.1221695283 * pow(temp - 60, -0.0755148492)
-            b = 255
-        ri = max(0, min(255, int(r)))
-        gi = max(0, min(255, int(g)))
-        bi = max(0, min(255, int(b)))
-        return f"#{ri:02x}{gi:02x}{bi:02x}"
+        # Whole CT branch collapses to a table lookup
+        ri, gi, bi = _CT_TO_RGB[(153 if ct < 153 else 500 if ct > 500 else ct) - 153]
+        return f"#{(ri << 16) | (gi << 8) | bi:06x}"
     return None
 
 
@@ -214,7 +358,7 @@ def _turn_on(hue: HueController, light_id: int) -> int:
     try:
         hue.turn_on(light_id)
         print_success(f"Light {fmt(light_id)} turned on")
-        notify("Hue", f"Light {light_id} on", str(HUE_LOGO))
+        notify("Hue", f"Light {light_id} on", HUE_LOGO)
         return 0
     except requests.exceptions.RequestException as e:
         print_error(f"Failed to turn on light {light_id}: {e}")
@@ -226,7 +370,7 @@ def _turn_off(hue: HueController, light_id: int) -> int:
     try:
         hue.turn_off(light_id)
         print_success(f"Light {fmt(light_id)} turned off")
-        notify("Hue", f"Light {light_id} off", str(HUE_LOGO))
+        notify("Hue", f"Light {light_id} off", HUE_LOGO)
         return 0
     except requests.exceptions.RequestException as e:
         print_error(f"Failed to turn off light {light_id}: {e}")
@@ -283,37 +427,37 @@ def _set_temperature(hue: HueController, light_id: int, ct: int) -> int:
         return 1
 
 
+# Hue sector formulas indexed by argmax(r, g, b): replaces the if/elif ladder
+_HUE_SECTOR = (
+    lambda r, g, b, d: ((g - b) / d) % 6,
+    lambda r, g, b, d: (b - r) / d + 2,
+    lambda r, g, b, d: (r - g) / d + 4,
+)
+
+
+@lru_cache(maxsize=64)
 def _hex_to_hue(hex_color: str) -> tuple[int, int]:
     """Convert hex color to Hue's hue/saturation values.
 
+    Pure function, cached: theme colors repeat across calls.
     Returns (hue: 0-65535, sat: 0-254).
     """
-    hex_color = hex_color.lstrip("#")
-    r, g, b = (int(hex_color[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
+    # One C-level decode instead of per-channel int parses
+    rgb = bytes.fromhex(hex_color[1:] if hex_color[0] == "#" else hex_color)
+    r, g, b = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
 
     max_c = max(r, g, b)
     min_c = min(r, g, b)
     diff = max_c - min_c
 
-    # Hue calculation
-    if diff == 0:
-        h = 0.0
-    elif max_c == r:
-        h = ((g - b) / diff) % 6
-    elif max_c == g:
-        h = (b - r) / diff + 2
-    else:
-        h = (r - g) / diff + 4
-    h = h / 6.0  # Normalize to 0-1
+    # Hue (normalized to 0-1), sector picked by argmax index
+    h = 0.0 if diff == 0 else _HUE_SECTOR[(r, g, b).index(max_c)](r, g, b, diff) / 6.0
 
     # Saturation calculation
     s = 0.0 if max_c == 0 else diff / max_c
 
     # Convert to Hue ranges
-    hue_val = int(h * 65535)
-    sat_val = int(s * 254)
-
-    return hue_val, sat_val
+    return int(h * 65535), int(s * 254)
 
 
 # Available theme colors
@@ -328,15 +472,14 @@ THEME_COLORS = (
 
 def _set_theme(hue: HueController, light_id: int, color_name: str = "primary") -> int:
     """Set light to matugen theme color."""
-    colors = get_colors()
-
     if color_name not in THEME_COLORS:
         print_error(f"Unknown theme color: {fmt(color_name)}")
         console.print(f"  [muted]Available:[/muted] {', '.join(THEME_COLORS)}")
         return 1
 
-    hex_color = getattr(colors, color_name)
-    hue_val, sat_val = _hex_to_hue(hex_color)
+    mtime_ns = _wall_mtime_ns()
+    hex_color = getattr(_colors_for_mtime(mtime_ns), color_name)
+    hue_val, sat_val = _theme_hsv(mtime_ns, color_name)
 
     try:
         hue.set_color(light_id, hue_val, sat_val)
@@ -344,13 +487,53 @@ def _set_theme(hue: HueController, light_id: int, color_name: str = "primary") -
             f"Light {fmt(light_id)} set to {fmt(color_name)} "
             f"[muted]({hex_color})[/muted]"
         )
-        notify("Hue", f"Light {light_id} --> {color_name}", str(HUE_LOGO))
+        notify("Hue", f"Light {light_id} --> {color_name}", HUE_LOGO)
+        return 0
+    except requests.exceptions.RequestException as e:
+        print_error(f"Failed to set theme color: {e}")
+        return 1
+
+
+def _set_theme_all(hue: HueController, color_name: str = "primary") -> int:
+    """Set every light to a matugen theme color with parallel writes."""
+    if color_name not in THEME_COLORS:
+        print_error(f"Unknown theme color: {fmt(color_name)}")
+        console.print(f"  [muted]Available:[/muted] {', '.join(THEME_COLORS)}")
+        return 1
+
+    mtime_ns = _wall_mtime_ns()
+    hex_color = getattr(_colors_for_mtime(mtime_ns), color_name)
+    hue_val, sat_val = _theme_hsv(mtime_ns, color_name)
+
+    try:
+        lights = hue.get_lights()
+        hue.set_many(
+            {int(lid): {"on": True, "hue": hue_val, "sat": sat_val} for lid in lights}
+        )
+        print_success(
+            f"{fmt(len(lights))} lights set to {fmt(color_name)} "
+            f"[muted]({hex_color})[/muted]"
+        )
+        notify("Hue", f"All lights --> {color_name}", HUE_LOGO)
         return 0
     except requests.exceptions.RequestException as e:
         print_error(f"Failed to set theme color: {e}")
         return 1
 
 
+def _off_all(hue: HueController) -> int:
+    """Turn every light off with parallel writes."""
+    try:
+        lights = hue.get_lights()
+        hue.set_many({int(lid): {"on": False} for lid in lights})
+        print_success(f"{fmt(len(lights))} lights turned off")
+        notify("Hue", "All lights off", HUE_LOGO)
+        return 0
+    except requests.exceptions.RequestException as e:
+        print_error(f"Failed to turn off lights: {e}")
+        return 1
+
+
 def _parse_int(value: str, name: str) -> int | None:
     """Parse integer argument with error handling."""
     try:
@@ -367,9 +550,118 @@ def _usage() -> int:
     return 1
 
 
+def _cmd_list(hue: HueController, rest: tuple[str, ...]) -> int:
+    return _list_lights(hue)
+
+
+def _cmd_on(hue: HueController, rest: tuple[str, ...]) -> int:
+    if not rest:
+        print_error("Missing light ID")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    if light_id is None:
+        return 1
+    return _turn_on(hue, light_id)
+
+
+def _cmd_off(hue: HueController, rest: tuple[str, ...]) -> int:
+    if not rest:
+        print_error("Missing light ID")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    if light_id is None:
+        return 1
+    return _turn_off(hue, light_id)
+
+
+def _cmd_brightness(hue: HueController, rest: tuple[str, ...]) -> int:
+    if len(rest) < 2:
+        print_error("Usage: wrp hue brightness <id> <percent>")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    value = _parse_int(rest[1], "brightness")
+    if light_id is None or value is None:
+        return 1
+    return _set_brightness(hue, light_id, value)
+
+
+def _cmd_color(hue: HueController, rest: tuple[str, ...]) -> int:
+    if len(rest) < 2:
+        print_error("Usage: wrp hue color <id> <hue> [sat]")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    sat = 254
+    if rest[1].startswith("#"):
+        hue_val, sat = _hex_to_hue(rest[1])
+    else:
+        hue_val = _parse_int(rest[1], "hue")
+        if len(rest) >= 3:
+            sat_val = _parse_int(rest[2], "saturation")
+            if sat_val is None:
+                return 1
+            sat = sat_val
+    if light_id is None or hue_val is None:
+        return 1
+    return _set_color(hue, light_id, hue_val, sat)
+
+
+def _cmd_temp(hue: HueController, rest: tuple[str, ...]) -> int:
+    if len(rest) < 2:
+        print_error("Usage: wrp hue temp <id> <153-500>")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    ct = _parse_int(rest[1], "temperature")
+    if light_id is None or ct is None:
+        return 1
+    return _set_temperature(hue, light_id, ct)
+
+
+def _cmd_theme(hue: HueController, rest: tuple[str, ...]) -> int:
+    if not rest:
+        print_error("Usage: wrp hue theme <id> [color]")
+        console.print(f"  [muted]Colors:[/muted] {', '.join(THEME_COLORS)}")
+        return 1
+    light_id = _parse_int(rest[0], "light ID")
+    if light_id is None:
+        return 1
+    color_name = rest[1] if len(rest) >= 2 else "primary"
+    return _set_theme(hue, light_id, color_name)
+
+
+def _cmd_theme_all(hue: HueController, rest: tuple[str, ...]) -> int:
+    return _set_theme_all(hue, rest[0] if rest else "primary")
+
+
+def _cmd_off_all(hue: HueController, rest: tuple[str, ...]) -> int:
+    return _off_all(hue)
+
+
+def _cmd_gui(hue: HueController, rest: tuple[str, ...]) -> int:
+    from matuwrap.gui.hue_gui import main as _gui
+    return _gui()
+
+
+# O(1) hashed dispatch instead of an if/elif subcommand ladder
+_DISPATCH = {
+    "list": _cmd_list,
+    "on": _cmd_on,
+    "off": _cmd_off,
+    "brightness": _cmd_brightness,
+    "color": _cmd_color,
+    "temp": _cmd_temp,
+    "theme": _cmd_theme,
+    "theme-all": _cmd_theme_all,
+    "off-all": _cmd_off_all,
+    "gui": _cmd_gui,
+}
+
+
 def run(*args: str) -> int:
     """Dispatch hue subcommands."""
-    if not _check_config():
+    # Credentials are read once on first use; check them inline at dispatch
+    _load_config()
+    if not (HUE_BRIDGE_IP and HUE_USERNAME):
+        _print_config_error()
         return 1
 
     hue = HueController(HUE_BRIDGE_IP, HUE_USERNAME)  # type: ignore[arg-type]
@@ -377,87 +669,8 @@ def run(*args: str) -> int:
     if not args:
         return _list_lights(hue)
 
-    cmd = args[0]
-
-    if cmd == "list":
-        return _list_lights(hue)
-
-    elif cmd == "on":
-        if len(args) < 2:
-            print_error("Missing light ID")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        if light_id is None:
-            return 1
-        return _turn_on(hue, light_id)
-
-    elif cmd == "off":
-        if len(args) < 2:
-            print_error("Missing light ID")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        if light_id is None:
-            return 1
-        return _turn_off(hue, light_id)
-
-    elif cmd == "brightness":
-        if len(args) < 3:
-            print_error("Usage: wrp hue brightness <id> <percent>")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        value = _parse_int(args[2], "brightness")
-        if light_id is None or value is None:
-            return 1
-        return _set_brightness(hue, light_id, value)
-
-    elif cmd == "color":
-        if len(args) < 3:
-            print_error("Usage: wrp hue color <id> <hue> [sat]")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        sat = 254
-        if not args[2].__contains__("#"):
-            hue_val = _parse_int(args[2], "hue")
-            if len(args) >= 4:
-                sat_val = _parse_int(args[3], "saturation")
-                if sat_val is None:
-                    return 1
-                sat = sat_val
-        else:
-            hex_hue = _hex_to_hue(args[2])
-            hue_val = _parse_int(str(hex_hue[0]), "hue")
-            sat_val = _parse_int(str(hex_hue[1]), "saturation")
-            if sat_val is not None:
-                sat = sat_val
-        if light_id is None or hue_val is None:
-            return 1
-        return _set_color(hue, light_id, hue_val, sat)
-
-    elif cmd == "temp":
-        if len(args) < 3:
-            print_error("Usage: wrp hue temp <id> <153-500>")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        ct = _parse_int(args[2], "temperature")
-        if light_id is None or ct is None:
-            return 1
-        return _set_temperature(hue, light_id, ct)
-
-    elif cmd == "theme":
-        if len(args) < 2:
-            print_error("Usage: wrp hue theme <id> [color]")
-            console.print(f"  [muted]Colors:[/muted] {', '.join(THEME_COLORS)}")
-            return 1
-        light_id = _parse_int(args[1], "light ID")
-        if light_id is None:
-            return 1
-        color_name = args[2] if len(args) >= 3 else "primary"
-        return _set_theme(hue, light_id, color_name)
-    
-    elif cmd == "gui":
-        from matuwrap.gui.hue_gui import main as _gui
-        return _gui()
-
-    else:
-        print_error(f"Unknown subcommand: {fmt(cmd)}")
+    handler = _DISPATCH.get(args[0])
+    if handler is None:
+        print_error(f"Unknown subcommand: {fmt(args[0])}")
         return _usage()
+    return handler(hue, args[1:])
@@ -1,6 +1,9 @@
 """Install matuwrap shell integration."""
 
+import os
 import re
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import shutil
@@ -137,9 +140,13 @@ def _backup(path: Path) -> Path | None:
     if not path.exists():
         return None
 
-    # Remove previous backups for this file
-    for old in sorted(path.parent.glob(f"{path.name}.*.bak")):
-        old.unlink()
+    # Remove previous backups for this file: one scandir pass, no glob
+    # fnmatch or sort (every match gets deleted anyway)
+    prefix = f"{path.name}."
+    with os.scandir(path.parent) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith(".bak"):
+                os.unlink(entry.path)
 
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup = path.with_name(f"{path.name}.{stamp}.bak")
@@ -148,6 +155,7 @@ def _backup(path: Path) -> Path | None:
 
 
 # Patterns for lines that the matuwrap shell script now handles.
+# Compiled once at module load; applied in a single sweep over the buffer.
 _PROMPT_RE = re.compile("|".join([
     r"git-prompt\.sh",
     r"GIT_PS1_",
@@ -159,18 +167,49 @@ _PROMPT_RE = re.compile("|".join([
     r"unset color_prompt",
     r"PS1=",
     r"\\e\]0;",
-]))
+]), re.MULTILINE)
 
 # Lines that close a block but aren't content (fi, esac, ;;, }, blank).
 _STRUCTURAL = frozenset({"", "fi", "esac", ";;", "}"})
 
+_PATH_RE = re.compile(r"\bPATH\b")
 
-def _find_prompt_region(lines: list[str]) -> tuple[int, int] | None:
+
+@dataclass(slots=True, frozen=True)
+class _ScanResult:
+    """Everything the patcher needs to know about a .bashrc, in one pass."""
+
+    prompt_hits: list[int]  # line indices matching _PROMPT_RE
+    last_path: int | None  # last non-comment line touching PATH
+    return_esac: int | None  # esac closing the non-interactive guard
+
+
+def _scan_bashrc(lines: list[str]) -> _ScanResult:
+    """Single sweep over the buffer collecting prompt hits, the last PATH
+    line and the non-interactive guard — instead of one loop per question."""
+    prompt_hits: list[int] = []
+    last_path = None
+    return_esac = None
+    in_guard = False
+    for i, line in enumerate(lines):
+        if _PROMPT_RE.search(line):
+            prompt_hits.append(i)
+        stripped = line.strip()
+        if _PATH_RE.search(line) and not stripped.startswith("#"):
+            last_path = i
+        if "*) return" in line:
+            in_guard = True
+        elif in_guard and return_esac is None and stripped == "esac":
+            return_esac = i
+    return _ScanResult(prompt_hits, last_path, return_esac)
+
+
+def _find_prompt_region(lines: list[str], scan: _ScanResult) -> tuple[int, int] | None:
     """Return (start, end) indices of the prompt-setup region to replace."""
-    hits = [i for i, l in enumerate(lines) if _PROMPT_RE.search(l)]
-    if not hits:
+    if not scan.prompt_hits:
         return None
-    start, end = hits[0], hits[-1]
+    start = scan.prompt_hits[0]
+    end = scan.prompt_hits[-1]
 
     # Expand backwards over leading comments / blanks
     while start > 0 and (
@@ -185,26 +224,19 @@ def _find_prompt_region(lines: list[str]) -> tuple[int, int] | None:
     return start, end
 
 
-def _find_insert_point(lines: list[str]) -> int:
+def _find_insert_point(lines: list[str], scan: _ScanResult) -> int:
     """Find the best insertion point — after the last PATH/export setup.
 
     The matuwrap script calls `wrp` which lives in ~/.local/bin, so it must
     be sourced *after* all PATH exports to ensure `command -v wrp` succeeds.
     """
     # After the last line that modifies PATH
-    last_path = None
-    for i, line in enumerate(lines):
-        if re.search(r"\bPATH\b", line) and not line.strip().startswith("#"):
-            last_path = i
-    if last_path is not None:
-        return last_path + 1
+    if scan.last_path is not None:
+        return scan.last_path + 1
 
     # After non-interactive guard
-    for i, line in enumerate(lines):
-        if "*) return" in line:
-            for j in range(i, len(lines)):
-                if lines[j].strip() == "esac":
-                    return j + 1
+    if scan.return_esac is not None:
+        return scan.return_esac + 1
 
     return len(lines)
 
@@ -215,8 +247,14 @@ def _patch_bashrc() -> bool:
         return False
 
     text = BASHRC.read_text()
+
+    # Steady-state fast path: already sourced and no old prompt setup left.
+    # Two text-level checks, no splitlines / line scan on the no-op case.
+    if SOURCE_LINE in text and not _PROMPT_RE.search(text):
+        return False
+
     lines = text.splitlines()
-    has_old = bool(_PROMPT_RE.search(text))
+    scan = _scan_bashrc(lines)
 
     # Check if source line exists and is already after all PATH exports
     source_idx = None
@@ -224,16 +262,12 @@ def _patch_bashrc() -> bool:
         if SOURCE_LINE in l:
             source_idx = i
             break
-    ideal_pos = _find_insert_point(lines)
-    already_ok = source_idx is not None and source_idx >= ideal_pos and not has_old
+    ideal_pos = _find_insert_point(lines, scan)
+    already_ok = source_idx is not None and source_idx >= ideal_pos and not scan.prompt_hits
 
     if already_ok:
         return False
 
-    backup = _backup(BASHRC)
-    if backup:
-        print_warning(f"Backed up  {backup}")
-
     # Strip any existing matuwrap source / comment lines (will re-add in position)
     lines = [
         l for l in lines
@@ -242,21 +276,40 @@ def _patch_bashrc() -> bool:
 
     source_block = ["", "# matuwrap shell integration", SOURCE_LINE]
 
-    # Remove old prompt region (git-prompt, venv, PS1, etc.) — matuwrap handles it
-    region = _find_prompt_region(lines)
+    # Rescan the filtered buffer; both region and insert point come from it
+    scan = _scan_bashrc(lines)
+    region = _find_prompt_region(lines, scan)
+    pos = _find_insert_point(lines, scan)
     if region:
         start, end = region
         # Collapse to a single blank line so surrounding sections stay spaced
         lines[start : end + 1] = [""]
-        console.print(
-            f"[muted]Removed old prompt region (lines {start + 1}-{end + 1})[/muted]"
-        )
+        # Shift the insert point past the collapsed region
+        if pos > end:
+            pos -= end - start
+        elif pos > start:
+            pos = start + 1
 
     # Insert source line after all PATH exports so `wrp` is on PATH
-    pos = _find_insert_point(lines)
     lines[pos:pos] = source_block
 
-    BASHRC.write_text("\n".join(lines) + "\n")
+    # Single join allocation; the trailing "" yields the final newline
+    new_text = "\n".join((*lines, ""))
+    if new_text == text:
+        # Byte-identical result: skip the backup and write entirely
+        return False
+
+    backup = _backup(BASHRC)
+    if backup:
+        print_warning(f"Backed up  {backup}")
+
+    if region:
+        start, end = region
+        console.print(
+            f"[muted]Removed old prompt region (lines {start + 1}-{end + 1})[/muted]"
+        )
+
+    BASHRC.write_text(new_text)
     print_success(f"Patched    {BASHRC}")
     return True
 
@@ -269,8 +322,15 @@ def _install_bash() -> int:
     if backup:
         print_warning(f"Backed up  {backup}")
 
-    SCRIPT_PATH.write_text(BASH_INTEGRATION.lstrip("\n"))
-    SCRIPT_PATH.chmod(0o644)
+    # Atomic install: write to a temp file in the same directory, set the
+    # mode on the open fd, then os.replace() — the script is never observed
+    # half-written and never exists with the wrong mode
+    with tempfile.NamedTemporaryFile(
+        "w", dir=SCRIPT_DIR, prefix=".matuwrap.", delete=False
+    ) as tmp:
+        os.fchmod(tmp.fileno(), 0o644)
+        tmp.write(BASH_INTEGRATION.lstrip("\n"))
+    os.replace(tmp.name, SCRIPT_PATH)
     print_success(f"Installed  {SCRIPT_PATH}")
 
     if not _patch_bashrc():
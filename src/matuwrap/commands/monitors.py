@@ -1,19 +1,37 @@
 """Monitor information command."""
 
-from matuwrap.core import hyprland
-from matuwrap.core.hyprland import TRANSFORMS, swap_if_rotated
-from matuwrap.core.theme import console, print_header, print_kv, print_error, fmt
+from operator import itemgetter
+
+from matuwrap.core.hyprland import (
+    TRANSFORMS,
+    HyprlandError,
+    get_monitors,
+    swap_if_rotated,
+)
+from matuwrap.core.theme import emit, print_error, fmt
 
 COMMAND = {
     "description": "Show monitor information",
 }
 
+# One C-level getter reads every flat field at once; hyprctl always
+# emits these keys, so the .get fallback below is for malformed entries
+_MONITOR_FIELDS = itemgetter(
+    "name", "id", "make", "model", "width", "height", "refreshRate",
+    "x", "y", "scale", "dpmsStatus", "transform",
+)
+
+# Fixed-shape rows fill constant templates in one C-level .format call
+# instead of re-splicing markup per monitor
+_RES_TMPL = "{}[unit]x[/unit]{} [unit]@[/unit] {}"
+_POS_TMPL = "{}[unit],[/unit]{}"
+
 
 def run(*args: str) -> int:
     """Display information about all connected monitors."""
     try:
-        monitors = hyprland.get_monitors()
-    except hyprland.HyprlandError as e:
+        monitors = get_monitors()
+    except HyprlandError as e:
         print_error(f"Failed to get monitors: {e}")
         return 1
 
@@ -21,38 +39,53 @@ def run(*args: str) -> int:
         print_error("No monitors found")
         return 1
 
+    # Buffer everything and print once: each console.print pays a full
+    # markup parse and stdout write, so seven calls per monitor become
+    # one call for the whole report
+    parts: list[str] = []
+
+    def kv(label: str, value: str) -> None:
+        parts.append(f"  [label]{label:<14}[/label] [value]{value}[/value]")
+
     for monitor in monitors:
-        name = monitor.get("name", "unknown")
-        monitor_id = monitor.get("id", "?")
-        make = monitor.get("make", "")
-        model = monitor.get("model", "")
-        width = monitor.get("width", 0)
-        height = monitor.get("height", 0)
-        refresh = round(monitor.get("refreshRate", 0))
-        x = monitor.get("x", 0)
-        y = monitor.get("y", 0)
-        scale = monitor.get("scale", 1)
+        try:
+            (name, monitor_id, make, model, width, height, refresh_raw,
+             x, y, scale, dpms_raw, transform) = _MONITOR_FIELDS(monitor)
+        except KeyError:
+            g = monitor.get
+            name = g("name", "unknown")
+            monitor_id = g("id", "?")
+            make = g("make", "")
+            model = g("model", "")
+            width = g("width", 0)
+            height = g("height", 0)
+            refresh_raw = g("refreshRate", 0)
+            x = g("x", 0)
+            y = g("y", 0)
+            scale = g("scale", 1)
+            dpms_raw = g("dpmsStatus", True)
+            transform = g("transform", 0)
+        refresh = round(refresh_raw)
         workspace = monitor.get("activeWorkspace", {}).get("name", "?")
-        dpms = "on" if monitor.get("dpmsStatus", True) else "off"
-        transform = monitor.get("transform", 0)
+        dpms = "on" if dpms_raw else "off"
 
         # Swap dimensions for 90° or 270° rotation
         width, height = swap_if_rotated(width, height, transform)
-        transform_label = TRANSFORMS.get(transform)
+        transform_label = TRANSFORMS[transform & 7]
 
-        print_header(f"{name} [muted](ID {fmt(monitor_id)})[/muted]")
-        print_kv("Model", fmt(f"{make} {model}".strip() or "unknown"))
+        parts.append(f"\n[title]{name} [muted](ID {fmt(monitor_id)})[/muted][/title]")
+        kv("Model", fmt(f"{make} {model}".strip() or "unknown"))
 
         # Resolution with optional transform label
-        res_str = f"{fmt(width)}[unit]x[/unit]{fmt(height)} [unit]@[/unit] {fmt(refresh, 'Hz')}"
+        res_str = _RES_TMPL.format(fmt(width), fmt(height), fmt(refresh, "Hz"))
         if transform_label:
             res_str += f" [muted]({transform_label})[/muted]"
-        print_kv("Resolution", res_str)
+        kv("Resolution", res_str)
 
-        print_kv("Position", f"{fmt(x)}[unit],[/unit]{fmt(y)}")
-        print_kv("Scale", fmt(scale))
-        print_kv("Workspace", fmt(workspace))
-        print_kv("DPMS", fmt(dpms))
+        kv("Position", _POS_TMPL.format(fmt(x), fmt(y)))
+        kv("Scale", fmt(scale))
+        kv("Workspace", fmt(workspace))
+        kv("DPMS", fmt(dpms))
 
-    console.print()
+    emit("\n".join(parts) + "\n")
     return 0
@@ -1,6 +1,8 @@
 """Sunshine streaming service control."""
 
-from pathlib import Path
+import os
+import re
+from typing import Final
 
 from matuwrap.core import hyprland, systemd
 from matuwrap.core.hyprland import TRANSFORMS, swap_if_rotated
@@ -31,27 +33,62 @@ COMMAND = {
     ],
 }
 
-SERVICE_NAME = "sunshine"
-CONFIG_PATH = Path.home() / ".config" / "sunshine" / "sunshine.conf"
+SERVICE_NAME: Final = "sunshine"
+# Plain string path: every pathlib operation allocates fresh Path objects,
+# which adds up on a cold-start-sensitive CLI
+CONFIG_PATH: Final = os.path.expanduser("~/.config/sunshine/sunshine.conf")
+
+# key = value lines, keys/values stripped, comments and blanks skipped
+_CFG_RE = re.compile(r"^[ \t]*([^#;=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+
+# Parsed config keyed on (st_mtime_ns, st_size): repeat reads within one
+# invocation (status + monitors both consult the config) cost one stat
+_CONFIG_CACHE: tuple[int, int, dict[str, str]] | None = None
 
 
 def _read_config() -> dict[str, str]:
-    """Read Sunshine config file into a dict."""
-    config = {}
-    if CONFIG_PATH.exists():
-        for line in CONFIG_PATH.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                config[key.strip()] = value.strip()
+    """Read Sunshine config file into a dict, cached on file mtime/size."""
+    global _CONFIG_CACHE
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[:2] == key:
+        return dict(_CONFIG_CACHE[2])
+
+    with open(CONFIG_PATH) as f:
+        text = f.read()
+    # One C-level regex sweep over the whole file; comments and blank
+    # lines simply don't match
+    config = {m[1]: m[2] for m in _CFG_RE.finditer(text)}
+    _CONFIG_CACHE = (*key, dict(config))
     return config
 
 
 def _write_config(config: dict[str, str]) -> None:
-    """Write config dict back to file."""
-    lines = [f"{k} = {v}" for k, v in config.items()]
-    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text("\n".join(lines) + "\n")
+    """Write config dict back to file atomically, skipping no-op writes."""
+    global _CONFIG_CACHE
+    new_text = "\n".join(f"{k} = {v}" for k, v in config.items()) + "\n"
+
+    # Unchanged content: no write, no mtime churn
+    try:
+        with open(CONFIG_PATH) as f:
+            if f.read() == new_text:
+                return
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+    tmp = CONFIG_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(new_text)
+    os.replace(tmp, CONFIG_PATH)
+    # Refresh the cache from what we just wrote instead of re-parsing
+    st = os.stat(CONFIG_PATH)
+    _CONFIG_CACHE = (st.st_mtime_ns, st.st_size, dict(config))
 
 
 def status() -> int:
@@ -134,10 +171,15 @@ def logs(lines: int = 50) -> int:
     print_header(f"Sunshine Logs [muted](last {fmt(lines)} lines)[/muted]")
     console.print()
 
-    log_output = systemd.get_logs(SERVICE_NAME, lines)
-    if log_output.strip():
-        console.print(log_output, highlight=False)
-    else:
+    # Stream lines as journalctl produces them instead of buffering
+    # the whole slice; first line is visible immediately
+    any_printed = False
+    for line in systemd.iter_logs(SERVICE_NAME, lines):
+        if line:
+            console.print(line, highlight=False)
+            any_printed = True
+
+    if not any_printed:
         print_info("No logs available")
 
     return 0
@@ -175,24 +217,28 @@ def list_monitors() -> int:
     table = create_table("", "Name", "Resolution", "Position")
 
     for m in monitors:
-        name = m.get("name", "unknown")
-        width = m.get("width", 0)
-        height = m.get("height", 0)
-        x = m.get("x", 0)
-        y = m.get("y", 0)
-        transform = m.get("transform", 0)
+        # One bound-method lookup per row instead of six
+        g = m.get
+        name = g("name", "unknown")
+        width = g("width", 0)
+        height = g("height", 0)
+        x = g("x", 0)
+        y = g("y", 0)
+        transform = g("transform", 0)
 
         # Swap dimensions for 90°/270° rotations
         width, height = swap_if_rotated(width, height, transform)
-        transform_label = TRANSFORMS.get(transform)
+        transform_label = TRANSFORMS[transform & 7]
 
         is_current = name == current
         indicator = "[bool_on]●[/bool_on]" if is_current else "[muted]○[/muted]"
-        name_fmt = f"[bool_on]{name}[/bool_on]" if is_current else fmt(name)
-        res_fmt = f"{fmt(width)}[unit]x[/unit]{fmt(height)}"
+        # Inline markup: all cell types are known here, so skip fmt()'s
+        # per-value dispatch in the row loop
+        name_fmt = f"[bool_on]{name}[/bool_on]" if is_current else f"[str]{name}[/str]"
+        res_fmt = f"[num]{width}[/num][unit]x[/unit][num]{height}[/num]"
         if transform_label:
             res_fmt += f" [muted]({transform_label})[/muted]"
-        pos_fmt = f"{fmt(x)}[unit],[/unit]{fmt(y)}"
+        pos_fmt = f"[num]{x}[/num][unit],[/unit][num]{y}[/num]"
 
         table.add_row(indicator, name_fmt, res_fmt, pos_fmt)
 
@@ -205,20 +251,24 @@ def run(*args: str) -> int:
     if not args:
         return status()
 
+    # match compiles to a static dispatch — no per-call dict or lambdas
     action, *rest = args
-    actions = {
-        "status": status,
-        "start": start,
-        "stop": stop,
-        "restart": restart,
-        "logs": lambda: logs(int(rest[0]) if rest else 50),
-        "monitor": lambda: set_monitor(rest[0]) if rest else list_monitors(),
-        "monitors": list_monitors,
-    }
-
-    if action not in actions:
-        print_error(f"Unknown action: {fmt(action)}")
-        print_info(f"Available: {', '.join(actions.keys())}")
-        return 1
-
-    return actions[action]()
+    match action:
+        case "status":
+            return status()
+        case "start":
+            return start()
+        case "stop":
+            return stop()
+        case "restart":
+            return restart()
+        case "logs":
+            return logs(int(rest[0]) if rest else 50)
+        case "monitor":
+            return set_monitor(rest[0]) if rest else list_monitors()
+        case "monitors":
+            return list_monitors()
+        case _:
+            print_error(f"Unknown action: {fmt(action)}")
+            print_info("Available: status, start, stop, restart, logs, monitor, monitors")
+            return 1
@@ -1,6 +1,6 @@
-"""Core utilities and shared components."""
+"""Core utilities and shared components.
 
-from matuwrap.core.theme import console, THEME
-from matuwrap.core.notify import notify
-
-__all__ = ["console", "THEME", "notify"]
+Intentionally empty: promoting submodules here would make every
+``import matuwrap.core.X`` pay for theme (Rich) and notify whether or
+not the command needs them. Import the submodule you want directly.
+"""
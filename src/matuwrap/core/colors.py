@@ -1,24 +1,20 @@
 """Dynamic color generation using matugen with native caching."""
 
-from collections.abc import Callable
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 WALLPAPER_PATH = Path.home() / ".current.wall"
 
-_native_get_colors: Callable[[str], dict[str, str]] | None = None
-_USE_NATIVE = False
+# Shared native probe — one import attempt per process
+from matuwrap._native import (
+    HAVE_NATIVE as _USE_NATIVE,
+    get_cached_colors as _native_get_colors,
+)
 
-# Try native implementation
-try:
-    from matuwrap.wrp_native import get_cached_colors as _native_get_colors # type: ignore
-    _USE_NATIVE = True
-except ImportError:
-    _USE_NATIVE = False
-    _native_get_colors = None  # type: ignore[assignment]
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Colors:
     """Material You color scheme from matugen."""
 
@@ -38,8 +34,9 @@ class Colors:
     outline_variant: str
 
     @classmethod
+    @lru_cache(maxsize=1)
     def default(cls) -> "Colors":
-        """Fallback colors when matugen unavailable."""
+        """Fallback colors when matugen unavailable (constant, built once)."""
         return cls(
             primary="#7aa2f7",
             on_primary="#1a1b26",
@@ -79,12 +76,19 @@ class Colors:
         )
 
 
+# Fully-built Colors keyed by (resolved path, mtime_ns): warm calls skip
+# the FFI round-trip and the from_dict construction entirely
+_COLORS_CACHE: tuple[str, int, Colors] | None = None
+
+
 def get_colors(wallpaper: Path | None = None) -> Colors:
     """Get color scheme from wallpaper using matugen.
 
-    Uses native Rust implementation with mtime-based caching.
+    Uses native Rust implementation with mtime-based caching, plus an
+    in-process Colors cache keyed by wallpaper path and mtime.
     Falls back to default colors if matugen unavailable or fails.
     """
+    global _COLORS_CACHE
     path = wallpaper or WALLPAPER_PATH
 
     if not path.exists():
@@ -95,10 +99,22 @@ def get_colors(wallpaper: Path | None = None) -> Colors:
     if _USE_NATIVE:
         if _native_get_colors is None:
             return Colors.default()
+        try:
+            mtime = os.stat(resolved).st_mtime_ns
+        except OSError:
+            return Colors.default()
+        if (
+            _COLORS_CACHE is not None
+            and _COLORS_CACHE[0] == resolved
+            and _COLORS_CACHE[1] == mtime
+        ):
+            return _COLORS_CACHE[2]
         colors = _native_get_colors(resolved)
-        if colors is not None:
-            return Colors.from_dict(colors)  # type: ignore
-        return Colors.default()
+        if colors is None:
+            return Colors.default()
+        built = Colors.from_dict(colors)
+        _COLORS_CACHE = (resolved, mtime, built)
+        return built
 
     # Fallback: no native, no matugen subprocess (removed for performance)
     return Colors.default()
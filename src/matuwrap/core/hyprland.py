@@ -1,47 +1,65 @@
 """Hyprland IPC wrapper using native socket communication."""
 
-from collections.abc import Callable
-from typing import Any
+from pathlib import Path
+from typing import Any, Final
 import json
-import subprocess
-import logging
-
-logger = logging.getLogger(__name__)
-
-_native_hyprctl: Callable[[str], str] | None = None
-_native_hyprctl_json: Callable[[str], str] | None = None
-_USE_NATIVE = False
+import os
+import time
+
+# Shared probe: matuwrap._native attempts the extension import once
+# per process, however many modules need it
+from matuwrap._native import (
+    HAVE_NATIVE as _USE_NATIVE,
+    hyprctl as _native_hyprctl,
+    hyprctl_json as _native_hyprctl_json,
+    hyprctl_json_batch as _native_hyprctl_json_batch,
+    hyprctl_json_parsed as _native_hyprctl_json_parsed,
+)
+
+if not _USE_NATIVE:
+    # logging (and subprocess, below) only load on the fallback path —
+    # with the compiled extension present neither is ever needed
+    import logging
+
+    logging.getLogger(__name__).warning(
+        "Native module unavailable, using subprocess fallback (slower)"
+    )
 
+# orjson parses the hyprctl replies 2-3x faster than stdlib json when
+# available; both decoders raise ValueError subclasses on bad input
 try:
-    from matuwrap.wrp_native import hyprctl as _native_hyprctl, hyprctl_json as _native_hyprctl_json
-    _USE_NATIVE = True
+    from orjson import loads as _loads
 except ImportError:
-    logger.warning("Native module unavailable, using subprocess fallback (slower)")
+    from json import loads as _loads
+
 
 class HyprlandError(Exception):
     """Raised when hyprctl command fails."""
 
 
-# Monitor transform values from Hyprland
+# Monitor transform labels from Hyprland, indexed by transform value.
 # https://wiki.hyprland.org/Configuring/Monitors/#rotating
-TRANSFORMS: dict[int, str | None] = {
-    0: None,            # Normal (no rotation)
-    1: "90°",           # 90 degrees
-    2: "180°",          # 180 degrees
-    3: "270°",          # 270 degrees
-    4: "flipped",       # Flipped
-    5: "flipped 90°",   # Flipped + 90
-    6: "flipped 180°",  # Flipped + 180
-    7: "flipped 270°",  # Flipped + 270
-}
+# A tuple indexes by offset (no hashing); use `transform & 7` so
+# out-of-range values stay safe
+TRANSFORMS: Final[tuple[str | None, ...]] = (
+    None,            # 0: Normal (no rotation)
+    "90°",           # 1: 90 degrees
+    "180°",          # 2: 180 degrees
+    "270°",          # 3: 270 degrees
+    "flipped",       # 4: Flipped
+    "flipped 90°",   # 5: Flipped + 90
+    "flipped 180°",  # 6: Flipped + 180
+    "flipped 270°",  # 7: Flipped + 270
+)
 
 
 def is_rotated(transform: int) -> bool:
     """Check if transform represents a 90° or 270° rotation.
 
-    These rotations swap width and height dimensions.
+    These rotations swap width and height dimensions. Rotated transforms
+    are exactly the odd ones (1, 3, 5, 7), so this is one bit test.
     """
-    return transform in (1, 3, 5, 7)
+    return bool(transform & 1)
 
 
 def swap_if_rotated(width: int, height: int, transform: int) -> tuple[int, int]:
@@ -55,9 +73,7 @@ def swap_if_rotated(width: int, height: int, transform: int) -> tuple[int, int]:
     Returns:
         Tuple of (width, height), swapped if rotated.
     """
-    if is_rotated(transform):
-        return height, width
-    return width, height
+    return (height, width) if transform & 1 else (width, height)
 
 
 def _run_hyprctl(*args: str) -> str:
@@ -65,8 +81,10 @@ def _run_hyprctl(*args: str) -> str:
     if _USE_NATIVE and _native_hyprctl is not None:
         command = " ".join(args)
         return _native_hyprctl(command)
-    
+
     # Fallback: use subprocess
+    import subprocess
+
     result = subprocess.run(
         ["hyprctl", *args],
         capture_output=True,
@@ -77,26 +95,123 @@ def _run_hyprctl(*args: str) -> str:
     return result.stdout
 
 
+# Memo for _query_json, keyed by the command args, scoped to one
+# command's execution: dispatch() clears it because any dispatcher can
+# mutate the state behind these reads, and long-lived hosts (the daemon,
+# the bench REPL) call clear_query_cache() between commands so the next
+# one re-reads live compositor state. Hits return the cached object by
+# reference — callers must not mutate results
+_json_cache: dict[tuple[str, ...], Any] = {}
+
+
+def clear_query_cache() -> None:
+    """Drop memoized _query_json results.
+
+    Hosts that dispatch many commands in one process must call this
+    between commands; within a single command the memo stays valid.
+    """
+    _json_cache.clear()
+
+
 def _query_json(*args: str) -> Any:
+    """Run hyprctl with -j flag and parse JSON output (memoized)."""
+    if args in _json_cache:
+        return _json_cache[args]
+    result = _query_json_uncached(*args)
+    _json_cache[args] = result
+    return result
+
+
+def _query_json_uncached(*args: str) -> Any:
     """Run hyprctl with -j flag and parse JSON output."""
+    # Best case: serde_json parsed the reply inside the extension and
+    # hands back Python objects — no second scan of the bytes here
+    if _USE_NATIVE and _native_hyprctl_json_parsed is not None:
+        try:
+            return _native_hyprctl_json_parsed(" ".join(args))
+        except ValueError as e:
+            raise HyprlandError(f"Invalid JSON from hyprctl: {e}")
+
     if _USE_NATIVE and _native_hyprctl_json is not None:
         command = " ".join(args)
         try:
-            return json.loads(_native_hyprctl_json(command))
-        except json.JSONDecodeError as e:
+            return _loads(_native_hyprctl_json(command))
+        except ValueError as e:
             raise HyprlandError(f"Invalid JSON from hyprctl: {e}")
 
     # Fallback: use subprocess
     output = _run_hyprctl("-j", *args)
     try:
-        return json.loads(output)
-    except json.JSONDecodeError as e:
+        return _loads(output)
+    except ValueError as e:
         raise HyprlandError(f"Invalid JSON from hyprctl: {e}")
 
 
+def query_batch(*cmds: str) -> list[Any]:
+    """Run several JSON queries in one [[BATCH]] socket round-trip.
+
+    Hyprland's batch protocol groups the commands into a single write
+    and single reply, instead of one connection per query. Results come
+    back in command order.
+    """
+    if _USE_NATIVE and _native_hyprctl_json_batch is not None:
+        try:
+            return [_loads(doc) for doc in _native_hyprctl_json_batch(*cmds)]
+        except ValueError as e:
+            raise HyprlandError(f"Invalid JSON from hyprctl: {e}")
+
+    # Fallback: one round-trip per command
+    return [_query_json(cmd) for cmd in cmds]
+
+
+# Opt-in persistent monitor cache: topology changes rarely, so repeated
+# invocations within the TTL can skip the socket round-trip entirely.
+# Keyed on the Hyprland instance signature; gated behind an env var.
+_MONITOR_CACHE_TTL: Final = 2.0
+
+
+def _monitor_cache_path() -> Path | None:
+    """Cache file for this Hyprland instance, or None when disabled."""
+    if os.environ.get("MATUWRAP_HYPR_CACHE") != "1":
+        return None
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if not runtime or not sig:
+        return None
+    return Path(runtime) / "matuwrap" / f"mon-{sig}.json"
+
+
+def invalidate_monitor_cache() -> None:
+    """Drop the cached monitor list (after monitor-changing dispatches)."""
+    cache = _monitor_cache_path()
+    if cache is not None:
+        try:
+            cache.unlink()
+        except OSError:
+            pass
+
+
 def get_monitors() -> list[dict]:
     """Get list of all monitors with their properties."""
-    return _query_json("monitors")
+    cache = _monitor_cache_path()
+    if cache is not None:
+        try:
+            if time.time() - cache.stat().st_mtime < _MONITOR_CACHE_TTL:
+                return _loads(cache.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+    monitors = _query_json("monitors")
+
+    if cache is not None:
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(".tmp")
+            tmp.write_text(json.dumps(monitors))
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+    return monitors
 
 
 def get_active_workspace() -> dict:
@@ -117,3 +232,8 @@ def get_active_window() -> dict:
 def dispatch(command: str, *args: str) -> None:
     """Execute a Hyprland dispatcher command."""
     _run_hyprctl("dispatch", command, *args)
+    # Any dispatcher can change the state behind cached queries
+    _json_cache.clear()
+    # Monitor-affecting dispatches make the cached topology stale
+    if command.startswith("monitor"):
+        invalidate_monitor_cache()
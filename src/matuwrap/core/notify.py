@@ -1,6 +1,74 @@
 """System notification wrapper using notify-send."""
 
-import subprocess
+import os
+import shutil
+
+# Urgency byte values from the Desktop Notifications spec
+_URGENCY = {"low": 0, "normal": 1, "critical": 2}
+
+# Resolved once; None means notifications silently no-op without D-Bus
+_NOTIFY_SEND = shutil.which("notify-send")
+_devnull_fd: int | None = None
+
+# Pids of notify-send children not yet reaped; only our own pids are
+# waited on so exit statuses of unrelated subprocess children stay put
+_pending_pids: list[int] = []
+
+# Session-bus connection, opened once on first notification. None until
+# then; False once D-Bus has failed and the subprocess path takes over.
+_dbus_conn = None
+
+
+def _notify_dbus(
+    title: str,
+    message: str,
+    icon: str | None,
+    urgency: str,
+    timeout: int,
+    app_name: str,
+) -> bool:
+    """Send via org.freedesktop.Notifications directly. Returns True on success.
+
+    Talking to the bus in-process skips the notify-send fork/exec and its
+    own D-Bus connect (~5-20 ms per notification).
+    """
+    global _dbus_conn
+    if _dbus_conn is False:
+        return False
+    try:
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+
+        if _dbus_conn is None:
+            _dbus_conn = open_dbus_connection(bus="SESSION")
+
+        notifications = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications",
+        )
+        msg = new_method_call(
+            notifications,
+            "Notify",
+            "susssasa{sv}i",
+            (
+                app_name,
+                0,  # replaces_id
+                icon or "",
+                title,
+                message,
+                [],  # actions
+                {"urgency": ("y", _URGENCY.get(urgency, 1))},
+                timeout,
+            ),
+        )
+        _dbus_conn.send_and_get_reply(msg)
+        return True
+    except Exception:
+        # jeepney missing, no session bus, broken connection, ... —
+        # remember and let notify-send handle it from now on
+        _dbus_conn = False
+        return False
 
 
 def notify(
@@ -11,7 +79,7 @@ def notify(
     timeout: int = 3000,
     app_name: str = "matuwrap",
 ) -> None:
-    """Send a desktop notification via notify-send.
+    """Send a desktop notification via D-Bus, or notify-send as fallback.
 
     Args:
         title: Notification title
@@ -21,6 +89,12 @@ def notify(
         timeout: Display time in milliseconds
         app_name: Application name for notification
     """
+    if _notify_dbus(title, message, icon, urgency, timeout, app_name):
+        return
+
+    if _NOTIFY_SEND is None:
+        return
+
     cmd = [
         "notify-send",
         "-t",
@@ -36,4 +110,26 @@ def notify(
 
     cmd.extend([title, message])
 
-    subprocess.run(cmd, check=False, capture_output=True)
+    # Fire and forget: spawn without fork, discard output, don't wait —
+    # the caller never looks at the result, so don't block on the child.
+    # Earlier children are reaped opportunistically here so long-lived
+    # hosts (the daemon, the bench REPL) don't accumulate zombies
+    global _devnull_fd
+    if _devnull_fd is None:
+        _devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    for pid in _pending_pids[:]:
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0] != 0:
+                _pending_pids.remove(pid)
+        except ChildProcessError:
+            _pending_pids.remove(pid)
+    pid = os.posix_spawn(
+        _NOTIFY_SEND,
+        cmd,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_DUP2, _devnull_fd, 1),
+            (os.POSIX_SPAWN_DUP2, _devnull_fd, 2),
+        ],
+    )
+    _pending_pids.append(pid)
@@ -1,10 +1,20 @@
 """Systemd user service management."""
 
+import shutil
 import subprocess
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+# Resolved once so each call skips the PATH search inside exec
+SYSTEMCTL = shutil.which("systemctl") or "systemctl"
 
-@dataclass
+# Session-bus connection to the user systemd instance. None until first
+# use; False once D-Bus has failed and systemctl takes over for good.
+_dbus_conn = None
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceStatus:
     """Status information for a systemd service."""
 
@@ -18,49 +28,109 @@ class ServiceStatus:
 def _run_systemctl(*args: str) -> subprocess.CompletedProcess:
     """Run systemctl --user command."""
     return subprocess.run(
-        ["systemctl", "--user", *args],
+        [SYSTEMCTL, "--user", *args],
         capture_output=True,
         text=True,
+        close_fds=False,
     )
 
 
-def get_status(name: str) -> ServiceStatus:
-    """Get status of a user service."""
-    is_active = _run_systemctl("is-active", name)
-    is_enabled = _run_systemctl("is-enabled", name)
+def _unit_dbus_path(unit: str) -> str:
+    """Object path of a unit: non-alphanumerics escaped as _XX hex."""
+    escaped = "".join(
+        c if c.isalnum() else f"_{ord(c):02x}" for c in unit
+    )
+    return f"/org/freedesktop/systemd1/unit/{escaped}"
 
-    status_text = is_active.stdout.strip()
-    active = status_text == "active"
-    enabled = is_enabled.stdout.strip() == "enabled"
 
-    # Get description
-    desc_result = _run_systemctl("show", name, "--property=Description")
-    desc_line = desc_result.stdout.strip()
-    description = desc_line.split("=", 1)[1] if "=" in desc_line else None
+def _status_via_dbus(name: str) -> dict[str, str] | None:
+    """Fetch unit properties over the session bus. None on any failure.
 
-    return ServiceStatus(
+    One in-process IPC round-trip instead of a systemctl fork+exec —
+    the difference dominates when status is polled repeatedly.
+    """
+    global _dbus_conn
+    if _dbus_conn is False:
+        return None
+    try:
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+
+        if _dbus_conn is None:
+            _dbus_conn = open_dbus_connection(bus="SESSION")
+
+        unit = name if "." in name else f"{name}.service"
+        props_addr = DBusAddress(
+            _unit_dbus_path(unit),
+            bus_name="org.freedesktop.systemd1",
+            interface="org.freedesktop.DBus.Properties",
+        )
+        msg = new_method_call(
+            props_addr, "GetAll", "s", ("org.freedesktop.systemd1.Unit",)
+        )
+        reply = _dbus_conn.send_and_get_reply(msg)
+        return {k: v[1] for k, v in reply.body[0].items()}
+    except Exception:
+        # jeepney missing, no session bus, unit not loaded, ... —
+        # remember and let systemctl handle it from now on
+        _dbus_conn = False
+        return None
+
+
+# A status query is a systemctl round-trip — the slowest thing the
+# service commands do. A short TTL lets back-to-back checks within one CLI
+# invocation reuse the answer; start/stop/restart drop the entry.
+_STATUS_TTL = 0.25
+_status_cache: dict[str, tuple[float, ServiceStatus]] = {}
+
+
+def get_status(name: str) -> ServiceStatus:
+    """Get status of a user service (cached briefly within a process)."""
+    now = time.monotonic()
+    cached = _status_cache.get(name)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    # D-Bus first; otherwise one `show` call answers everything
+    # is-active/is-enabled did, collapsing three fork+execs into one
+    props = _status_via_dbus(name)
+    if props is None:
+        result = _run_systemctl(
+            "show", name, "--property=ActiveState,UnitFileState,Description"
+        )
+        props = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+
+    status_text = props.get("ActiveState", "unknown")
+    svc = ServiceStatus(
         name=name,
-        active=active,
-        enabled=enabled,
+        active=status_text == "active",
+        enabled=props.get("UnitFileState") == "enabled",
         status=status_text,
-        description=description,
+        description=props.get("Description") or None,
     )
+    _status_cache[name] = (now + _STATUS_TTL, svc)
+    return svc
 
 
 def start(name: str) -> bool:
     """Start a user service. Returns True on success."""
+    _status_cache.pop(name, None)
     result = _run_systemctl("start", name)
     return result.returncode == 0
 
 
 def stop(name: str) -> bool:
     """Stop a user service. Returns True on success."""
+    _status_cache.pop(name, None)
     result = _run_systemctl("stop", name)
     return result.returncode == 0
 
 
 def restart(name: str) -> bool:
     """Restart a user service. Returns True on success."""
+    _status_cache.pop(name, None)
     result = _run_systemctl("restart", name)
     return result.returncode == 0
 
@@ -78,3 +148,25 @@ def get_logs(name: str, lines: int = 50) -> str:
     if result.returncode != 0:
         return result.stderr or f"Failed to get logs for {name}"
     return result.stdout
+
+
+def iter_logs(name: str, lines: int = 50) -> Iterator[str]:
+    """Yield recent log lines for a user service as they arrive.
+
+    Streams journalctl output line-by-line instead of buffering the
+    whole journal slice, so the first line prints immediately and
+    memory stays bounded for large line counts.
+    """
+    proc = subprocess.Popen(
+        ["journalctl", "--user", "-u", name, "-n", str(lines), "--no-pager"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        proc.wait()
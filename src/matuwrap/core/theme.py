@@ -1,20 +1,69 @@
 """Centralized Rich theme and styled output helpers with matugen colors."""
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.theme import Theme
+from __future__ import annotations
 
-from matuwrap.core.colors import get_colors
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
-# Load colors from wallpaper (cached at import time)
-_colors = get_colors()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.theme import Theme
+
+
+def _load_or_parse_styles(styles: dict[str, str]) -> dict[str, object]:
+    """Parsed Style objects for the style-string map, pickle-cached.
+
+    Theme accepts Style instances directly, skipping its per-string
+    parser. The cache key covers the strings and the Rich version, so a
+    wallpaper change or Rich upgrade rebuilds it transparently.
+    """
+    import hashlib
+    import pickle
+    from importlib.metadata import version
+
+    key = hashlib.sha1(
+        (repr(sorted(styles.items())) + version("rich")).encode()
+    ).hexdigest()
+    cache = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "matuwrap",
+        "theme.pkl",
+    )
+    try:
+        with open(cache, "rb") as f:
+            cached_key, parsed = pickle.load(f)
+        if cached_key == key:
+            return parsed
+    except Exception:
+        pass
+
+    from rich.style import Style
+
+    parsed = {name: Style.parse(value) for name, value in styles.items()}
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        tmp = cache + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((key, parsed), f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return parsed
 
 
 def _build_theme() -> Theme:
     """Build Rich theme from matugen colors."""
+    from rich.theme import Theme
+
+    from matuwrap.core.colors import get_colors
+
+    _colors = get_colors()
     return Theme(
-        {
+        _load_or_parse_styles({
             "title": f"bold {_colors.primary}",
             "label": f"{_colors.outline}",
             "value": f"{_colors.on_surface}",
@@ -31,74 +80,144 @@ def _build_theme() -> Theme:
             "bool_on": f"bold {_colors.secondary}",
             "bool_off": f"{_colors.outline_variant}",
             "unit": f"{_colors.outline}",
-        }
+        })
     )
 
 
-THEME = _build_theme()
-console = Console(theme=THEME)
+def __getattr__(name: str) -> object:
+    """Build THEME and console on first access (PEP 562).
+
+    Importing Rich and reading the wallpaper palette costs more than many
+    whole commands; commands that never print styled output skip it.
+    """
+    if name in ("THEME", "console"):
+        from rich.console import Console
+
+        theme = _build_theme()
+        globals()["THEME"] = theme
+        # Decide TTY-ness once so Console skips its terminal probing;
+        # piped output gets plain text at a fixed width
+        is_tty = sys.stdout.isatty()
+        if is_tty:
+            width = None
+        else:
+            try:
+                width = int(os.environ.get("COLUMNS", 120))
+            except ValueError:
+                width = 120
+        globals()["console"] = Console(
+            theme=theme,
+            force_terminal=is_tty,
+            color_system="truecolor" if is_tty else None,
+            width=width,
+            highlight=False,
+            markup=True,
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _console() -> Console:
+    """Themed console for the helpers below, triggering lazy construction."""
+    return globals().get("console") or __getattr__("console")  # type: ignore[return-value]
+
+
+# Matches the named style tags used in command output ([title],
+# [/bool_on], ...); colors never appear inline, so this stays simple
+_TAG_RE: Final = re.compile(r"\[/?[a-z_]+\]")
+
+
+def emit(text: str) -> None:
+    """Print markup text via Rich on a TTY, plain otherwise.
+
+    When stdout is piped (`wrp monitors | grep ...`) Rich's markup
+    parse and render pass buys nothing; one regex strip and a raw
+    write skip that path — and the theme build behind it — entirely.
+    """
+    if sys.stdout.isatty():
+        _console().print(text)
+    else:
+        sys.stdout.write(_TAG_RE.sub("", text) + "\n")
 
 
 def print_header(text: str | None) -> None:
     """Print a styled header."""
     if text is not None:
-        console.print(f"\n[title]{text}[/title]")
+        _console().print(f"\n[title]{text}[/title]")
 
 
 def print_kv(label: str, value: str, label_width: int = 14) -> None:
     """Print a key-value pair with aligned label."""
-    console.print(f"  [label]{label:<{label_width}}[/label] [value]{value}[/value]")
+    _console().print(f"  [label]{label:<{label_width}}[/label] [value]{value}[/value]")
 
 
+# fmt() runs once per table cell; constant markup and precomputed
+# renders keep the hot loops out of repeated branch/format work
+_BOOL_ON: Final = "[bool_on]ON[/bool_on]"
+_BOOL_OFF: Final = "[bool_off]OFF[/bool_off]"
+_TRUTHY: Final = frozenset({"on", "true", "yes", "enabled"})
+_FALSY: Final = frozenset({"off", "false", "no", "disabled"})
+
+# Fully-rendered markup per bool-ish label, keyed casefolded: one dict
+# lookup replaces two membership tests plus an f-string per call, and
+# upper() of the casefolded key matches upper() of any case variant
+_BOOL_RENDER: Final[dict[str, str]] = {
+    **{k: f"[bool_on]{k.upper()}[/bool_on]" for k in _TRUTHY},
+    **{k: f"[bool_off]{k.upper()}[/bool_off]" for k in _FALSY},
+}
+
+
+# typed=True keeps True/1 and 1/1.0 as distinct cache keys — fmt styles
+# them differently even though they compare equal
+@lru_cache(maxsize=256, typed=True)
 def fmt(value: str | int | float | bool, unit: str = "") -> str:
-    """Format a value with type-appropriate styling.
+    """Format a value with type-appropriate styling (memoized).
 
     - Strings: str style
     - Numbers: num style (with optional unit in unit style)
     - Bools: bool_on/bool_off style, displayed as ON/OFF
     """
-    if isinstance(value, bool):
-        if value:
-            return "[bool_on]ON[/bool_on]"
-        return "[bool_off]OFF[/bool_off]"
+    t = type(value)
+    if t is bool:
+        return _BOOL_ON if value else _BOOL_OFF
 
-    if isinstance(value, (int, float)):
+    if t is int or t is float:
         if unit:
             return f"[num]{value}[/num][unit]{unit}[/unit]"
         return f"[num]{value}[/num]"
 
     # String - check for on/off/true/false
-    lower = str(value).lower()
-    if lower in ("on", "true", "yes", "enabled"):
-        return f"[bool_on]{value.upper()}[/bool_on]"
-    if lower in ("off", "false", "no", "disabled"):
-        return f"[bool_off]{value.upper()}[/bool_off]"
+    rendered = _BOOL_RENDER.get(str(value).casefold())
+    if rendered is not None:
+        return rendered
 
     return f"[str]{value}[/str]"
 
 
 def print_success(text: str) -> None:
     """Print a success message."""
-    console.print(f"[success]✓[/success] {text}")
+    _console().print(f"[success]✓[/success] {text}")
 
 
 def print_error(text: str) -> None:
     """Print an error message."""
-    console.print(f"[error]✗[/error] {text}")
+    _console().print(f"[error]✗[/error] {text}")
 
 
 def print_warning(text: str) -> None:
     """Print a warning message."""
-    console.print(f"[warning]![/warning] {text}")
+    _console().print(f"[warning]![/warning] {text}")
 
 
 def print_info(text: str) -> None:
     """Print an info message."""
-    console.print(f"[info]∟[/info] {text}")
+    _console().print(f"[info]∟[/info] {text}")
 
 
 def create_table(*columns: str, title: str | None = None) -> Table:
     """Create a styled table with consistent formatting."""
+    from rich.table import Table
+
     table = Table(
         title=title,
         title_style="title",
@@ -115,7 +234,9 @@ def create_table(*columns: str, title: str | None = None) -> Table:
 
 def print_panel(content: str, title: str | None = None) -> None:
     """Print content in a styled panel."""
-    console.print(
+    from rich.panel import Panel
+
+    _console().print(
         Panel(
             content,
             title=title,
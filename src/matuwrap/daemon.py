@@ -0,0 +1,195 @@
+"""Warm-process daemon keeping Python, Rich and the native module loaded.
+
+Most commands finish in well under 100 ms of real work wrapped in several
+hundred ms of interpreter start, imports and theme construction. With
+MATUWRAP_DAEMON=1, `wrp` forwards argv over a Unix socket to a long-lived
+process that already paid those costs and falls back to in-process
+execution when no daemon answers.
+
+Run the server with `python -m matuwrap.daemon`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 4-byte big-endian length prefix framing both directions
+_HEADER = struct.Struct("!I")
+
+_SPAWN_RETRIES = 20
+_SPAWN_DELAY = 0.05
+
+
+def socket_path() -> Path:
+    """Per-user daemon socket under the runtime dir."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    return Path(runtime) / "matuwrap.sock"
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("socket closed mid-message")
+        buf += chunk
+    return buf
+
+
+def _send_msg(sock: socket.socket, payload: dict) -> None:
+    data = json.dumps(payload).encode()
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_msg(sock: socket.socket) -> dict:
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, length))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Dispatch one forwarded command and stream its output back."""
+
+    def handle(self) -> None:
+        req = _recv_msg(self.request)
+        argv: list[str] = req.get("argv", [])
+        cwd = req.get("cwd")
+
+        # Per-request memos scoped to "one command" must not leak across
+        # forwarded commands in this long-lived process; only clear when
+        # the module is already loaded — importing it here would defeat
+        # the lazy import for commands that never touch Hyprland
+        hypr = sys.modules.get("matuwrap.core.hyprland")
+        if hypr is not None:
+            hypr.clear_query_cache()
+
+        out = io.StringIO()
+        code = 1
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+                if not argv:
+                    out.write("usage: wrp <command> [args]\n")
+                else:
+                    command, *rest = argv
+                    module = importlib.import_module(f"matuwrap.commands.{command}")
+                    code = module.run(*rest)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except ModuleNotFoundError:
+            out.write(f"Unknown command: {argv[0]}\n")
+        except Exception as e:  # keep the daemon alive when a command crashes
+            out.write(f"error: {e}\n")
+
+        _send_msg(self.request, {"code": code, "output": out.getvalue()})
+
+
+def _preload() -> None:
+    """Import the expensive bits once so every request starts warm."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from matuwrap.cli import _COMMANDS
+    from matuwrap.core.theme import console  # noqa: F401  builds the Rich theme
+
+    # Thread-parallel imports: the import lock serializes module
+    # initialization, but the file reads and .pyc stats of each
+    # module's transitive imports overlap, so warm-up approaches the
+    # slowest module rather than the sum
+    names = list(_COMMANDS)
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+        for _ in ex.map(
+            lambda n: importlib.import_module(f"matuwrap.commands.{n}"), names
+        ):
+            pass
+
+
+def serve() -> int:
+    """Run the daemon until killed."""
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+    _preload()
+    # Requests are handled one at a time: handle() mutates process-wide
+    # state (chdir, stdout/stderr redirection), so concurrent handlers
+    # would interleave output and working directories between clients
+    with socketserver.UnixStreamServer(str(path), _Handler) as server:
+        # The XDG_RUNTIME_DIR-less fallback lands in /tmp; keep the
+        # socket private so other users cannot drive this daemon
+        os.chmod(path, 0o600)
+        server.serve_forever()
+    return 0
+
+
+def _spawn_daemon() -> None:
+    """Start a detached daemon for subsequent invocations."""
+    subprocess.Popen(
+        [sys.executable, "-m", "matuwrap.daemon"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def forward(argv: list[str]) -> int | None:
+    """Forward argv to the daemon and relay its output.
+
+    Returns the command's exit code, or None when no daemon could be
+    reached — the caller then runs the command in-process.
+    """
+    path = str(socket_path())
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(10.0)
+    try:
+        try:
+            sock.connect(path)
+        except OSError:
+            # First invocation: start the daemon and give it a moment
+            _spawn_daemon()
+            for _ in range(_SPAWN_RETRIES):
+                time.sleep(_SPAWN_DELAY)
+                try:
+                    sock.connect(path)
+                    break
+                except OSError:
+                    continue
+            else:
+                return None
+
+        _send_msg(sock, {"argv": list(argv), "cwd": os.getcwd()})
+
+        # The daemon is executing the command now: falling back would
+        # run it a second time, so wait for the reply however long it
+        # takes and turn a lost connection into an error, not a retry
+        sock.settimeout(None)
+        try:
+            reply = _recv_msg(sock)
+        except (OSError, ValueError):
+            sys.stderr.write("wrp: daemon connection lost mid-command\n")
+            return 1
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+    sys.stdout.write(reply.get("output", ""))
+    code = reply.get("code", 1)
+    return code if isinstance(code, int) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
@@ -1,9 +1,21 @@
 import sys
 import os
-from dataclasses import dataclass
-
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor, QBrush, QFont
+import time
+from dataclasses import dataclass, field, replace
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QColor, QBrush, QFont, QPainter
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -13,8 +25,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QGroupBox,
     QSlider,
@@ -22,10 +33,10 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QLineEdit,
     QCheckBox,
+    QStyledItemDelegate,
     QAbstractItemView,
     QSizePolicy,
     QFrame,
-    QGraphicsDropShadowEffect,
 )
 
 from matuwrap.commands.hue import HueController, _check_config
@@ -40,6 +51,13 @@ from glaze import (
 )
 from glaze.widgets import RoundedHeaderView, ThemedComboBox
 
+# NumPy vectorizes the per-row hue->HSV arithmetic when available;
+# the pure-Python fallback below produces identical colors
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 
 def clamp(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, v))
@@ -69,17 +87,9 @@ def contrast_text(bg: QColor) -> QColor:
     return QColor("#111111") if lum > 160 else QColor("#f2f2f2")
 
 
-class NumericTableItem(QTableWidgetItem):
-    """Table item that sorts numerically instead of alphabetically."""
-
-    def __lt__(self, other: QTableWidgetItem) -> bool:
-        try:
-            return int(self.text()) < int(other.text())
-        except ValueError:
-            return super().__lt__(other)
-
-
-@dataclass
+# slots=True: no per-instance __dict__ for rows rebuilt on every
+# refresh; stays mutable because update_light writes fields in place
+@dataclass(slots=True)
 class LightRow:
     light_id: int
     name: str
@@ -88,6 +98,328 @@ class LightRow:
     hue: int | None
     sat: int | None
     ct: int | None
+    # Derived once here so per-keystroke filtering doesn't rebuild
+    # throwaway casefolded/str copies for every row
+    name_lower: str = field(init=False)
+    id_str: str = field(init=False)
+
+    def __post_init__(self):
+        self.name_lower = self.name.casefold()
+        self.id_str = str(self.light_id)
+
+
+# Minimum spacing between bridge PUTs during a continuous slider drag
+_APPLY_INTERVAL = 0.15
+
+# Column order shared by model and view
+COL_ID, COL_NAME, COL_STATE, COL_BRI, COL_COLOR, COL_CT = range(6)
+_HEADERS = ("ID", "Name", "State", "Bri", "Color", "CT")
+
+# (background QColor, text QBrush) pair for the Color column delegate
+ROLE_COLOR_PAIR = Qt.ItemDataRole.UserRole + 1
+
+
+# Color pairs keyed on quantized (hue, sat, bri). The bridge reports
+# discrete-ish values, so a handful of lights saturates this immediately
+# and steady-state refreshes stop doing HSV math entirely.
+_PAIR_CACHE: dict[tuple[int, int, int], tuple[QColor, QBrush]] = {}
+
+
+def _fill_pair_cache(misses: list[tuple[tuple[int, int, int], LightRow]]) -> None:
+    """Compute and cache color pairs for uncached quantization keys.
+
+    With NumPy installed the scale/round/clamp arithmetic runs as three
+    array ops over all misses; otherwise hue_sat_to_qcolor does the
+    same math per row.
+    """
+    if _np is not None and len(misses) > 1:
+        n = len(misses)
+        hues = _np.fromiter((r.hue or 0 for _, r in misses), dtype=_np.float32, count=n)
+        sats = _np.fromiter((r.sat or 0 for _, r in misses), dtype=_np.int32, count=n)
+        bris = _np.fromiter((max(r.bri, 30) for _, r in misses), dtype=_np.int32, count=n)
+        qt_h = _np.rint(hues * (359.0 / 65535.0)).astype(_np.int32)
+        qt_s = _np.clip(sats, 0, 254)
+        qt_v = _np.clip(bris, 1, 254)
+        for (key, _), h, s, v in zip(misses, qt_h, qt_s, qt_v):
+            bg = QColor.fromHsv(int(h), int(s), int(v))
+            _PAIR_CACHE[key] = (bg, QBrush(contrast_text(bg)))
+        return
+
+    for key, row in misses:
+        bg = hue_sat_to_qcolor(int(row.hue or 0), int(row.sat or 0), max(row.bri, 30))
+        _PAIR_CACHE[key] = (bg, QBrush(contrast_text(bg)))
+
+
+def _row_colors(rows: list[LightRow]) -> list[tuple[QColor, QBrush] | None]:
+    """Per-row (background color, text brush) for the Color column.
+
+    Computed once per refresh instead of once per data() call, and
+    served from _PAIR_CACHE so only genuinely new colors cost any
+    conversion work.
+    """
+    keys: list[tuple[int, int, int] | None] = []
+    misses: list[tuple[tuple[int, int, int], LightRow]] = []
+    for row in rows:
+        if row.is_on and row.hue is not None and row.sat is not None:
+            key = (int(row.hue) >> 8, int(row.sat) >> 2, max(row.bri, 30) >> 3)
+            keys.append(key)
+            if key not in _PAIR_CACHE:
+                misses.append((key, row))
+        else:
+            keys.append(None)
+
+    if misses:
+        _fill_pair_cache(misses)
+    return [_PAIR_CACHE[k] if k is not None else None for k in keys]
+
+
+def _changed_columns(a: LightRow, b: LightRow) -> list[int]:
+    """Columns affected by the differences between two rows."""
+    cols = []
+    if a.name != b.name:
+        cols.append(COL_NAME)
+    if a.is_on != b.is_on:
+        cols += [COL_STATE, COL_BRI, COL_COLOR]
+    if a.bri != b.bri:
+        cols += [COL_BRI, COL_COLOR]
+    if a.hue != b.hue or a.sat != b.sat:
+        cols.append(COL_COLOR)
+    if a.ct != b.ct:
+        cols.append(COL_CT)
+    return cols
+
+
+class HueLightsModel(QAbstractTableModel):
+    """Table model over the LightRow cache.
+
+    The view only asks for data of visible cells, so a refresh updates
+    the row list instead of rebuilding a widget per cell.
+    """
+
+    def __init__(self, theme, parent=None):
+        super().__init__(parent)
+        self._rows: list[LightRow] = []
+        self._colors: list[tuple[QColor, QBrush] | None] = []
+        self.set_theme(theme)
+
+    def set_theme(self, theme) -> None:
+        self._brush_secondary = QBrush(QColor(theme.text_secondary))
+        self._brush_success = QBrush(QColor(theme.success))
+        self._brush_disabled = QBrush(QColor(theme.text_disabled))
+        self._font_name = QFont("", 11, QFont.Weight.Medium)
+        self._font_state = QFont("", 10, QFont.Weight.Bold)
+
+    def set_rows(self, rows: list[LightRow]) -> bool:
+        """Swap in a fresh row list, diffing against the previous one.
+
+        Steady-state refreshes rarely change anything, so when the set
+        and order of light ids is unchanged only the cells of modified
+        rows are invalidated. Returns True when a full reset happened
+        (lights added/removed), i.e. when selection needs restoring.
+        """
+        old = self._rows
+        if len(old) != len(rows) or any(
+            a.light_id != b.light_id for a, b in zip(old, rows)
+        ):
+            self.beginResetModel()
+            self._rows = rows
+            self._colors = _row_colors(rows)
+            self.endResetModel()
+            return True
+
+        self._rows = rows
+        for i, (a, b) in enumerate(zip(old, rows)):
+            if a == b:
+                # Keep the existing row object and its cached color so
+                # unchanged lights cost no allocations per refresh
+                rows[i] = a
+                continue
+            cols = _changed_columns(a, b)
+            if COL_COLOR in cols:
+                self._colors[i] = _row_colors([b])[0]
+            self.dataChanged.emit(
+                self.index(i, min(cols)), self.index(i, max(cols))
+            )
+        return False
+
+    def row(self, row: int) -> LightRow:
+        return self._rows[row]
+
+    def find(self, light_id: int) -> LightRow | None:
+        for row in self._rows:
+            if row.light_id == light_id:
+                return row
+        return None
+
+    def update_light(self, light_id: int, **fields) -> None:
+        """Apply known state changes locally without a bridge round-trip.
+
+        After set_brightness etc. the new state is already known, so
+        mutate the cached row and invalidate just its changed cells
+        instead of re-fetching every light over HTTP.
+        """
+        for i, row in enumerate(self._rows):
+            if row.light_id != light_id:
+                continue
+            old = replace(row)
+            for name, value in fields.items():
+                setattr(row, name, value)
+            cols = _changed_columns(old, row)
+            if cols:
+                if COL_COLOR in cols:
+                    self._colors[i] = _row_colors([row])[0]
+                self.dataChanged.emit(
+                    self.index(i, min(cols)), self.index(i, max(cols))
+                )
+            return
+
+    # ---- Qt model API ----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return _HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == COL_ID:
+                return row.id_str
+            if col == COL_NAME:
+                return row.name
+            if col == COL_STATE:
+                return "  ON" if row.is_on else "  OFF"
+            if col == COL_BRI:
+                return f"{bri_to_pct(row.bri) if row.is_on else 0}%"
+            if col == COL_COLOR:
+                pair = self._colors[index.row()]
+                return pair[0].name() if pair else "-"
+            if col == COL_CT:
+                return str(row.ct) if row.ct is not None else "-"
+
+        elif role == Qt.ItemDataRole.UserRole:
+            # Sort keys: plain ints/strings, no text re-parsing
+            if col == COL_ID:
+                return row.light_id
+            if col == COL_NAME:
+                return row.name
+            if col == COL_STATE:
+                return int(row.is_on)
+            if col == COL_BRI:
+                return row.bri if row.is_on else 0
+            if col == COL_COLOR:
+                return row.hue or 0
+            if col == COL_CT:
+                return row.ct or 0
+
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if col == COL_STATE:
+                return self._brush_success if row.is_on else self._brush_disabled
+            if col in (COL_ID, COL_BRI, COL_CT):
+                return self._brush_secondary
+
+        elif role == ROLE_COLOR_PAIR:
+            if col == COL_COLOR:
+                return self._colors[index.row()]
+
+        elif role == Qt.ItemDataRole.FontRole:
+            if col == COL_NAME:
+                return self._font_name
+            if col == COL_STATE:
+                return self._font_state
+
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if col == COL_COLOR:
+                return Qt.AlignmentFlag.AlignCenter
+            if col == COL_STATE:
+                return Qt.AlignmentFlag.AlignVCenter
+
+        return None
+
+
+class ColorPillDelegate(QStyledItemDelegate):
+    """Paints the Color column swatch directly with QPainter.
+
+    The previous per-cell QLabel approach parsed a stylesheet per
+    widget per refresh; a delegate draws from the cached color pair
+    with zero widget allocations.
+    """
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        pair = index.data(ROLE_COLOR_PAIR)
+        if not pair:
+            super().paint(painter, option, index)
+            return
+
+        bg, fg = pair
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, 8, 8)
+        painter.setPen(fg.color())
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, bg.name())
+        painter.restore()
+
+
+class _FetchSignals(QObject):
+    """Signal sidecar for _FetchLightsTask (QRunnable can't emit)."""
+
+    finished = Signal(dict)
+    failed = Signal(str)
+
+
+class _FetchLightsTask(QRunnable):
+    """Fetch the light map from the bridge on a pool thread.
+
+    The HTTP round-trip to the bridge otherwise blocks the GUI thread
+    on every auto-refresh, stalling repaints and input handling.
+    """
+
+    def __init__(self, hue: HueController):
+        super().__init__()
+        self.hue = hue
+        self.signals = _FetchSignals()
+
+    def run(self) -> None:
+        try:
+            self.signals.finished.emit(self.hue.get_lights())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class LightFilterProxy(QSortFilterProxyModel):
+    """Search + only-on filtering over HueLightsModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.needle = ""
+        self.only_on = False
+        self.setSortRole(Qt.ItemDataRole.UserRole)
+
+    def set_filters(self, needle: str, only_on: bool) -> None:
+        self.needle = needle
+        self.only_on = only_on
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        row = self.sourceModel().row(source_row)
+        if self.only_on and not row.is_on:
+            return False
+        needle = self.needle
+        return not needle or needle in row.name_lower or needle in row.id_str
 
 
 class HueDashboard(QMainWindow):
@@ -107,6 +439,17 @@ class HueDashboard(QMainWindow):
         self.selected_light_id: int | None = None
         self._updating_ui = False
         self._rows_cache: list[LightRow] = []
+        self._refresh_inflight = False
+        self._user_interacting = False
+        self._last_bri_apply = 0.0
+        self._last_temp_apply = 0.0
+        self._bri_inflight = False
+        self._temp_inflight = False
+        self._color_dlg: QColorDialog | None = None
+        self._theme_key: int | None = None
+        self._pill_styles: dict[str, str] = {}
+        self._pill_state: tuple[str, str] | None = None
+        self._sorted_ids: list[str] | None = None
 
         # debounce timers (prevents slider spam)
         self.bri_apply_timer = QTimer(self)
@@ -133,14 +476,24 @@ class HueDashboard(QMainWindow):
         self.theme, self._backend = generate_theme(image_path=wallpaper)
 
     def _set_status_text(self, text: str, dot_color: str):
-        """Set status pill text with properly aligned colored dot."""
-        self.status_pill.setText(
-            f'<table cellpadding="0" cellspacing="0" align="center">'
-            f'<tr>'
-            f'<td style="vertical-align: middle; color: {dot_color}; font-size: 9px; padding-right: 4px; padding-left: 4x;">●</td>'
-            f'<td style="vertical-align: middle;">{text}</td>'
-            f'</tr></table>'
-        )
+        """Set status pill text with a colored leading dot.
+
+        Plain text plus a widget-level color rule: the old HTML-table
+        markup made QLabel parse HTML through QTextDocument on every
+        successful refresh. Stylesheets are cached per dot color, and
+        identical updates are skipped entirely.
+        """
+        if (text, dot_color) == self._pill_state:
+            return
+        self._pill_state = (text, dot_color)
+
+        style = self._pill_styles.get(dot_color)
+        if style is None:
+            style = f"QLabel#statusPill {{ color: {dot_color}; }}"
+            self._pill_styles[dot_color] = style
+
+        self.status_pill.setText(f"● {text}")
+        self.status_pill.setStyleSheet(style)
 
     # ---------------- UI ----------------
 
@@ -194,23 +547,24 @@ class HueDashboard(QMainWindow):
         toolbar.addWidget(QLabel("Auto:"))
         toolbar.addWidget(self.auto_refresh_combo)
 
-        # Table container with shadow effect
+        # Table container; depth comes from the border styling below.
+        # A QGraphicsDropShadowEffect here would force Qt to rasterize
+        # and blur the whole table offscreen on every repaint.
         self.table_container = QFrame()
         self.table_container.setObjectName("tableContainer")
         table_container_layout = QVBoxLayout(self.table_container)
         table_container_layout.setContentsMargins(0, 0, 0, 0)
         table_container_layout.setSpacing(0)
 
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        self.table_container.setGraphicsEffect(shadow)
+        # Model/view: the model wraps the row cache, the proxy filters and
+        # sorts, and the view materializes only the visible cells
+        self.model = HueLightsModel(self.theme, self)
+        self.proxy = LightFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
 
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "State", "Bri", "Color", "CT"])
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(COL_COLOR, ColorPillDelegate(self.table))
         self.table.setShowGrid(False)
         self.table.setFrameShape(QFrame.Shape.NoFrame)
 
@@ -220,16 +574,16 @@ class HueDashboard(QMainWindow):
         self.table.setHorizontalHeader(self.header)
 
         # Column sizing: ID fixed small, others stretch
-        self.header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)      # ID
-        self.header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)    # Name
-        self.header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)      # State
-        self.header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)      # Bri
-        self.header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)    # Color
-        self.header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)      # CT
-        self.table.setColumnWidth(0, 50)   # ID - narrower
-        self.table.setColumnWidth(2, 70)   # State
-        self.table.setColumnWidth(3, 60)   # Bri
-        self.table.setColumnWidth(5, 60)   # CT
+        self.header.setSectionResizeMode(COL_ID, QHeaderView.ResizeMode.Fixed)
+        self.header.setSectionResizeMode(COL_NAME, QHeaderView.ResizeMode.Stretch)
+        self.header.setSectionResizeMode(COL_STATE, QHeaderView.ResizeMode.Fixed)
+        self.header.setSectionResizeMode(COL_BRI, QHeaderView.ResizeMode.Fixed)
+        self.header.setSectionResizeMode(COL_COLOR, QHeaderView.ResizeMode.Stretch)
+        self.header.setSectionResizeMode(COL_CT, QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(COL_ID, 50)    # ID - narrower
+        self.table.setColumnWidth(COL_STATE, 70)
+        self.table.setColumnWidth(COL_BRI, 60)
+        self.table.setColumnWidth(COL_CT, 60)
 
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -237,16 +591,17 @@ class HueDashboard(QMainWindow):
 
         if (v_header := self.table.verticalHeader()) is not None:
             v_header.setVisible(False)
+            v_header.setDefaultSectionSize(44)
 
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSortingEnabled(True)
-        self.table.sortByColumn(0, Qt.SortOrder.AscendingOrder)  # Default sort by ID
+        self.table.sortByColumn(COL_ID, Qt.SortOrder.AscendingOrder)  # Default sort by ID
         self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.table.setWordWrap(False)
         self.table.setMouseTracking(True)
-        self.table.setRowHeight(0, 42)
-        self.table.itemSelectionChanged.connect(self._on_table_selection)
-        self.table.itemDoubleClicked.connect(self._on_double_click)
+        if (sel_model := self.table.selectionModel()) is not None:
+            sel_model.selectionChanged.connect(self._on_table_selection)
+        self.table.doubleClicked.connect(self._on_double_click)
 
         table_container_layout.addWidget(self.table)
 
@@ -292,6 +647,8 @@ class HueDashboard(QMainWindow):
         self.bri_slider.setRange(0, 100)
         self.bri_slider.setValue(100)
         self.bri_slider.valueChanged.connect(self._brightness_changed)
+        self.bri_slider.sliderPressed.connect(self._interaction_started)
+        self.bri_slider.sliderReleased.connect(self._interaction_ended)
 
         self.bri_spin = QSpinBox()
         self.bri_spin.setRange(0, 100)
@@ -330,6 +687,8 @@ class HueDashboard(QMainWindow):
         self.temp_slider.setRange(153, 500)
         self.temp_slider.setValue(350)
         self.temp_slider.valueChanged.connect(self._temp_changed)
+        self.temp_slider.sliderPressed.connect(self._interaction_started)
+        self.temp_slider.sliderReleased.connect(self._interaction_ended)
 
         self.temp_spin = QSpinBox()
         self.temp_spin.setRange(153, 500)
@@ -356,6 +715,17 @@ class HueDashboard(QMainWindow):
     def _apply_theme(self):
         t = self.theme
 
+        # setStyleSheet reparses the QSS and re-polishes every
+        # descendant widget; skip all of it when the theme is unchanged
+        # (e.g. a reload that regenerated the same palette)
+        try:
+            key = hash(tuple(sorted(vars(t).items())))
+        except TypeError:
+            key = hash(repr(vars(t)))
+        if key == self._theme_key:
+            return
+        self._theme_key = key
+
         # Get base stylesheet from Glaze
         base_styles = get_base_stylesheet(t)
         dialog_styles = get_dialog_stylesheet(t)
@@ -415,21 +785,29 @@ class HueDashboard(QMainWindow):
                 border-color: {t.accent};
             }}
 
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px 8px;
             }}
         """
 
         self.setStyleSheet(base_styles + dialog_styles + table_container_styles + custom_styles)
 
-        # Apply table container style directly
+        # Apply table container style directly; the heavier bottom
+        # border stands in for the old drop-shadow effect
         if hasattr(self, 'table_container'):
-            self.table_container.setStyleSheet(get_table_container_style(t))
+            self.table_container.setStyleSheet(
+                get_table_container_style(t)
+                + "\nQFrame#tableContainer { border-bottom: 2px solid rgba(0, 0, 0, 80); }"
+            )
 
         # Update header colors
         if hasattr(self, 'header'):
             self.header.refresh_theme()
 
+        # Refresh the model's cached brushes/fonts
+        if hasattr(self, 'model'):
+            self.model.set_theme(t)
+
     def _set_controls_enabled(self, enabled: bool):
         self.on_btn.setEnabled(enabled)
         self.off_btn.setEnabled(enabled)
@@ -456,124 +834,95 @@ class HueDashboard(QMainWindow):
         sec = int(txt.replace("s", ""))
         self.timer.start(sec * 1000)
 
-    def refresh_now(self):
-        try:
-            lights = self.hue.get_lights()
-            rows: list[LightRow] = []
-            for lid_str, light in sorted(lights.items(), key=lambda x: int(x[0])):
-                lid = int(lid_str)
-                state = light.get("state", {})
-                rows.append(
-                    LightRow(
-                        light_id=lid,
-                        name=light.get("name", f"Light {lid}"),
-                        is_on=bool(state.get("on", False)),
-                        bri=int(state.get("bri", 0) or 0),
-                        hue=state.get("hue"),
-                        sat=state.get("sat"),
-                        ct=state.get("ct"),
-                    )
-                )
+    def _interaction_started(self):
+        self._user_interacting = True
 
-            self._rows_cache = rows
-            self._apply_filters()
-            self._set_status_text("Connected", "#4ade80")
-        except Exception as e:
-            self._set_status_text("Error", "#f87171")
-            QMessageBox.critical(self, "Hue Error", str(e))
+    def _interaction_ended(self):
+        self._user_interacting = False
 
-    def _apply_filters(self):
-        text = self.search.text().strip().lower()
-        only_on = self.only_on.isChecked()
+    def refresh_now(self):
+        # Coalesce: a refresh already on the wire answers this one too
+        if self._refresh_inflight:
+            return
+        # Mid-drag or with an apply pending, a refresh would fight the
+        # user's slider and re-sync controls from stale bridge state
+        if (
+            self._user_interacting
+            or self.bri_apply_timer.isActive()
+            or self.temp_apply_timer.isActive()
+        ):
+            return
+        self._refresh_inflight = True
+        task = _FetchLightsTask(self.hue)
+        task.signals.finished.connect(self._on_lights_fetched)
+        task.signals.failed.connect(self._on_lights_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_lights_fetched(self, lights: dict):
+        self._refresh_inflight = False
+        # Lights rarely appear or vanish — reuse the sorted id order
+        # between refreshes and only re-sort when the key set changes
+        if self._sorted_ids is None or set(self._sorted_ids) != lights.keys():
+            self._sorted_ids = sorted(lights, key=int)
+
+        rows: list[LightRow] = []
+        for lid_str in self._sorted_ids:
+            light = lights[lid_str]
+            lid = int(lid_str)
+            state = light.get("state", {})
+            rows.append(
+                LightRow(
+                    light_id=lid,
+                    name=light.get("name", f"Light {lid}"),
+                    is_on=bool(state.get("on", False)),
+                    bri=int(state.get("bri", 0) or 0),
+                    hue=state.get("hue"),
+                    sat=state.get("sat"),
+                    ct=state.get("ct"),
+                )
+            )
 
-        rows = self._rows_cache
-        if text:
-            rows = [r for r in rows if text in r.name.lower() or text in str(r.light_id)]
-        if only_on:
-            rows = [r for r in rows if r.is_on]
+        self._rows_cache = rows
+        self._updating_ui = True
+        # Batch the repaint: no intermediate layout/paint while the
+        # model swap and selection restore land
+        self.table.setUpdatesEnabled(False)
+        try:
+            if self.model.set_rows(rows):
+                self._restore_selection()
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self._updating_ui = False
+        viewport = self.table.viewport()
+        if viewport is not None:
+            viewport.update()
+        self._set_status_text("Connected", "#4ade80")
 
-        self._render_table(rows)
+    def _on_lights_failed(self, message: str):
+        self._refresh_inflight = False
+        self._set_status_text("Error", "#f87171")
+        QMessageBox.critical(self, "Hue Error", message)
 
-    def _render_table(self, rows: list[LightRow]):
+    def _apply_filters(self):
+        text = self.search.text().strip().casefold()
         self._updating_ui = True
-        # Disable sorting while populating to prevent duplicate/reorder bugs
-        self.table.setSortingEnabled(False)
         try:
-            self.table.setRowCount(len(rows))
-
-            t = self.theme
-            text_secondary = QColor(t.text_secondary)
-            success_color = QColor(t.success)
-            disabled_color = QColor(t.text_disabled)
-
-            for r, row in enumerate(rows):
-                self.table.setRowHeight(r, 44)
-
-                # ID (numeric sorting)
-                id_item = NumericTableItem(str(row.light_id))
-                id_item.setForeground(QBrush(text_secondary))
-
-                # Name
-                name_item = QTableWidgetItem(row.name)
-                name_item.setFont(QFont("", 11, QFont.Weight.Medium))
-
-                # State (badge-ish)
-                state_item = QTableWidgetItem("  ON" if row.is_on else "  OFF")
-                state_item.setFont(QFont("", 10, QFont.Weight.Bold))
-                state_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter)
-
-                if row.is_on:
-                    state_item.setForeground(QBrush(success_color))
-                else:
-                    state_item.setForeground(QBrush(disabled_color))
-
-                # Brightness
-                bri_pct = bri_to_pct(row.bri) if row.is_on else 0
-                bri_item = QTableWidgetItem(f"{bri_pct}%")
-                bri_item.setForeground(QBrush(text_secondary))
-
-                # Color pill - use widget to override stylesheet background
-                color_label = QLabel("-")
-                color_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                if row.is_on and row.hue is not None and row.sat is not None:
-                    qc = hue_sat_to_qcolor(int(row.hue), int(row.sat), max(row.bri, 30))
-                    text_color = contrast_text(qc)
-                    color_label.setText(qc.name())
-                    color_label.setStyleSheet(f"""
-                        background-color: {qc.name()};
-                        color: {text_color.name()};
-                        font-size: 10px;
-                        font-weight: bold;
-                        border-radius: 4px;
-                        padding: 2px 4px;
-                    """)
-
-                # Temp
-                ct_item = QTableWidgetItem(str(row.ct) if row.ct is not None else "-")
-                ct_item.setForeground(QBrush(text_secondary))
-
-                self.table.setItem(r, 0, id_item)
-                self.table.setItem(r, 1, name_item)
-                self.table.setItem(r, 2, state_item)
-                self.table.setItem(r, 3, bri_item)
-                self.table.setCellWidget(r, 4, color_label)
-                self.table.setItem(r, 5, ct_item)
-
-            # restore selection
-            if self.selected_light_id is not None:
-                for r in range(self.table.rowCount()):
-                    item = self.table.item(r, 0)
-                    if item is None:
-                        continue
-                    if int(item.text()) == self.selected_light_id:
-                        self.table.selectRow(r)
-                        break
-
+            self.proxy.set_filters(text, self.only_on.isChecked())
+            self._restore_selection()
         finally:
             self._updating_ui = False
-            self.table.setSortingEnabled(True)
 
-    def _on_double_click(self, item: QTableWidgetItem):
+    def _restore_selection(self):
+        """Re-select the previously selected light after a reset/refilter."""
+        if self.selected_light_id is None:
+            return
+        for r in range(self.proxy.rowCount()):
+            idx = self.proxy.index(r, COL_ID)
+            if self.proxy.data(idx, Qt.ItemDataRole.UserRole) == self.selected_light_id:
+                self.table.selectRow(r)
+                return
+
+    def _on_double_click(self, index):
         # double click any row toggles
         self._with_selected(self._toggle)
 
@@ -583,26 +932,29 @@ class HueDashboard(QMainWindow):
         if self._updating_ui:
             return
 
-        row = self.table.currentRow()
-        if row < 0:
+        sel_model = self.table.selectionModel()
+        selected = sel_model.selectedRows() if sel_model is not None else []
+        if not selected:
             self.selected_light_id = None
             self.selected_label.setText("No light selected")
             self._set_controls_enabled(False)
             return
 
-        id_item = self.table.item(row, 0)
-        name_item = self.table.item(row, 1)
-        if id_item is None or name_item is None:
+        proxy_row = selected[0].row()
+        light_id = self.proxy.data(
+            self.proxy.index(proxy_row, COL_ID), Qt.ItemDataRole.UserRole
+        )
+        name = self.proxy.data(self.proxy.index(proxy_row, COL_NAME))
+        if light_id is None:
             return
 
-        light_id = int(id_item.text())
-        self.selected_light_id = light_id
-        self.selected_label.setText(f"Selected: Light {light_id} • {name_item.text()}")
+        self.selected_light_id = int(light_id)
+        self.selected_label.setText(f"Selected: Light {light_id} • {name}")
         self._set_controls_enabled(True)
 
         # sync controls from bridge
         try:
-            light = self.hue.get_light(light_id)
+            light = self.hue.get_light(self.selected_light_id)
             state = light.get("state", {})
             bri = int(state.get("bri", 254) or 254)
             ct = int(state.get("ct", 350) or 350)
@@ -625,80 +977,118 @@ class HueDashboard(QMainWindow):
             return
         try:
             fn(self.selected_light_id)
-            self.refresh_now()
         except Exception as e:
             QMessageBox.critical(self, "Hue Error", str(e))
 
     def _turn_on(self, light_id: int):
         self.hue.turn_on(light_id)
+        self.model.update_light(light_id, is_on=True)
 
     def _turn_off(self, light_id: int):
         self.hue.turn_off(light_id)
+        self.model.update_light(light_id, is_on=False)
 
     def _toggle(self, light_id: int):
         self.hue.toggle(light_id)
-
-    # ---------------- Debounced sliders ----------------
+        row = self.model.find(light_id)
+        if row is not None:
+            self.model.update_light(light_id, is_on=not row.is_on)
+
+    # ---------------- Throttled sliders ----------------
+    #
+    # Leading + trailing throttle: the first value of a drag applies
+    # immediately (the light reacts right away), intermediate values are
+    # rate-limited to one PUT per _APPLY_INTERVAL, and the trailing
+    # timer always delivers the final position.
+
+    def _schedule_bri_apply(self):
+        if (
+            time.monotonic() - self._last_bri_apply > _APPLY_INTERVAL
+            and not self._bri_inflight
+        ):
+            self._apply_brightness_debounced()
+        else:
+            self.bri_apply_timer.start(150)
+
+    def _schedule_temp_apply(self):
+        if (
+            time.monotonic() - self._last_temp_apply > _APPLY_INTERVAL
+            and not self._temp_inflight
+        ):
+            self._apply_temp_debounced()
+        else:
+            self.temp_apply_timer.start(150)
+
+    def _mirror(self, value: int, dst, schedule):
+        """Mirror a value into the paired widget, then schedule an apply.
+
+        QSignalBlocker is exception-safe where manual blockSignals pairs
+        are not; skipping equal values avoids the style recomputation
+        setValue triggers even for no-op assignments.
+        """
+        if dst.value() != value:
+            with QSignalBlocker(dst):
+                dst.setValue(value)
+        schedule()
 
     def _brightness_changed(self, pct: int):
         if self._updating_ui:
             return
-        self.bri_spin.blockSignals(True)
-        self.bri_spin.setValue(pct)
-        self.bri_spin.blockSignals(False)
-
-        # debounce apply (feels MUCH nicer)
-        self.bri_apply_timer.start(120)
+        self._mirror(pct, self.bri_spin, self._schedule_bri_apply)
 
     def _brightness_spin_changed(self, pct: int):
         if self._updating_ui:
             return
-        self.bri_slider.blockSignals(True)
-        self.bri_slider.setValue(pct)
-        self.bri_slider.blockSignals(False)
-
-        self.bri_apply_timer.start(120)
+        self._mirror(pct, self.bri_slider, self._schedule_bri_apply)
 
     def _apply_brightness_debounced(self):
-        if self.selected_light_id is None:
+        if self.selected_light_id is None or self._bri_inflight:
             return
-        pct = self.bri_spin.value()
-        self.hue.set_brightness(self.selected_light_id, pct_to_bri(pct))
-        self.refresh_now()
+        self._last_bri_apply = time.monotonic()
+        self._bri_inflight = True
+        try:
+            bri = pct_to_bri(self.bri_spin.value())
+            self.hue.set_brightness(self.selected_light_id, bri)
+            # The new state is known — no need to re-fetch all lights
+            self.model.update_light(self.selected_light_id, bri=bri)
+        finally:
+            self._bri_inflight = False
 
     def _temp_changed(self, ct: int):
         if self._updating_ui:
             return
-        self.temp_spin.blockSignals(True)
-        self.temp_spin.setValue(ct)
-        self.temp_spin.blockSignals(False)
-
-        self.temp_apply_timer.start(120)
+        self._mirror(ct, self.temp_spin, self._schedule_temp_apply)
 
     def _temp_spin_changed(self, ct: int):
         if self._updating_ui:
             return
-        self.temp_slider.blockSignals(True)
-        self.temp_slider.setValue(ct)
-        self.temp_slider.blockSignals(False)
-
-        self.temp_apply_timer.start(120)
+        self._mirror(ct, self.temp_slider, self._schedule_temp_apply)
 
     def _apply_temp_debounced(self):
-        if self.selected_light_id is None:
+        if self.selected_light_id is None or self._temp_inflight:
             return
-        ct = self.temp_spin.value()
-        self.hue.set_temperature(self.selected_light_id, ct)
-        self.refresh_now()
+        self._last_temp_apply = time.monotonic()
+        self._temp_inflight = True
+        try:
+            ct = self.temp_spin.value()
+            self.hue.set_temperature(self.selected_light_id, ct)
+            self.model.update_light(self.selected_light_id, ct=ct)
+        finally:
+            self._temp_inflight = False
 
     # ---------------- Color ----------------
 
     def _pick_color(self, light_id: int):
-        dlg = QColorDialog(self)
-        dlg.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel, False)
+        # One dialog for the window's lifetime: QColorDialog builds a
+        # pile of child widgets, and reuse keeps the custom palette
+        if self._color_dlg is None:
+            self._color_dlg = QColorDialog(self)
+            self._color_dlg.setOption(
+                QColorDialog.ColorDialogOption.ShowAlphaChannel, False
+            )
 
-        if dlg.exec():
-            c = dlg.selectedColor()
+        if self._color_dlg.exec():
+            c = self._color_dlg.selectedColor()
 
             h = c.hsvHue()          # 0..359 or -1
             s = c.hsvSaturation()   # 0..255
@@ -707,6 +1097,7 @@ class HueDashboard(QMainWindow):
             sat_val = int(round((s / 255) * 254))
 
             self.hue.set_color(light_id, hue_val, sat_val)
+            self.model.update_light(light_id, is_on=True, hue=hue_val, sat=sat_val)
 
     def _apply_theme_color(self, light_id: int):
         colors = get_colors()
@@ -721,6 +1112,7 @@ class HueDashboard(QMainWindow):
         sat_val = int(round((s / 255) * 254))
 
         self.hue.set_color(light_id, hue_val, sat_val)
+        self.model.update_light(light_id, is_on=True, hue=hue_val, sat=sat_val)
 
 def main():
     app = QApplication(sys.argv)
@@ -730,4 +1122,4 @@ def main():
     return app.exec()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -47,6 +47,46 @@ def hyprctl_json(command: str) -> str:
     """
     ...
 
+def hyprctl_json_batch(*commands: str) -> list[str]:
+    """Query multiple Hyprland IPC commands in a single socket round-trip.
+
+    Uses Hyprland's [[BATCH]] protocol, amortizing connection and
+    syscall cost across all queries.
+
+    Args:
+        *commands: Hyprland IPC commands (e.g., "monitors", "workspaces").
+
+    Returns:
+        One JSON string per command, in order.
+
+    Raises:
+        RuntimeError: If HYPRLAND_INSTANCE_SIGNATURE not set or the reply
+            cannot be split into one document per command.
+        ConnectionError: If socket connection fails.
+        IOError: If read/write fails.
+    """
+    ...
+
+def hyprctl_json_parsed(command: str) -> object:
+    """Query Hyprland IPC and return parsed Python objects.
+
+    Parsing happens once in Rust (serde_json); Python never re-scans
+    the reply bytes.
+
+    Args:
+        command: Hyprland IPC command (e.g., "monitors", "clients").
+
+    Returns:
+        The decoded JSON document (list/dict/str/int/float/bool/None).
+
+    Raises:
+        RuntimeError: If HYPRLAND_INSTANCE_SIGNATURE not set.
+        ConnectionError: If socket connection fails.
+        IOError: If read/write fails.
+        ValueError: If the reply is not valid JSON.
+    """
+    ...
+
 # Matugen color caching
 
 def get_cached_colors(wallpaper_path: str) -> dict[str, str]:
@@ -126,7 +166,19 @@ def memory_info() -> tuple[int, int, int]:
     ...
 
 def cpu_usage() -> float:
-    """Get CPU usage as percentage.
+    """Get CPU usage as percentage from a background sampler.
+
+    The first call blocks for ~100ms to take an initial sample and
+    spawns a refresher thread; later calls return the latest cached
+    reading without blocking.
+
+    Returns:
+        CPU usage percentage (0.0 - 100.0).
+    """
+    ...
+
+def cpu_usage_sync() -> float:
+    """Get CPU usage as percentage with a synchronous sample.
 
     Note: This function blocks for ~100ms to get accurate reading.
 
@@ -0,0 +1,37 @@
+"""Tests for matuwrap.cli module."""
+
+import importlib
+import pkgutil
+import unittest
+
+from matuwrap import commands
+from matuwrap.cli import _COMMANDS
+
+
+class TestCommandRegistry(unittest.TestCase):
+    """The static registry must mirror the command modules."""
+
+    def test_registry_matches_modules(self):
+        """Each module's COMMAND dict should equal its registry entry."""
+        for name in _COMMANDS:
+            module = importlib.import_module(f"matuwrap.commands.{name}")
+            self.assertEqual(
+                getattr(module, "COMMAND", None),
+                _COMMANDS[name],
+                f"registry entry for {name!r} is out of sync",
+            )
+
+    def test_registry_covers_all_modules(self):
+        """Every command module with a COMMAND dict should be registered."""
+        for module_info in pkgutil.iter_modules(commands.__path__):
+            if module_info.name.startswith("_"):
+                continue
+            module = importlib.import_module(
+                f"matuwrap.commands.{module_info.name}"
+            )
+            if hasattr(module, "COMMAND"):
+                self.assertIn(module_info.name, _COMMANDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
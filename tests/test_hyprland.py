@@ -11,7 +11,7 @@ class TestTransforms(unittest.TestCase):
     def test_transforms_has_all_values(self):
         """TRANSFORMS should have entries for 0-7."""
         for i in range(8):
-            self.assertIn(i, TRANSFORMS)
+            self.assertLess(i, len(TRANSFORMS))
 
     def test_transforms_normal_is_none(self):
         """Transform 0 (normal) should be None."""
@@ -1,7 +1,6 @@
 """Tests for matuwrap.core.theme module."""
 
 import unittest
-from io import StringIO
 
 from rich.console import Console
 from rich.table import Table
@@ -45,98 +44,47 @@ class TestThemeConstants(unittest.TestCase):
             self.assertIn(style_name, THEME.styles, f"Missing style: {style_name}")
 
 
-class TestFmt(unittest.TestCase):
-    """Tests for fmt() formatting function."""
-
-    def test_fmt_bool_true(self):
-        """fmt(True) should return ON with bool_on style."""
-        result = fmt(True)
-        self.assertIn("bool_on", result)
-        self.assertIn("ON", result)
-
-    def test_fmt_bool_false(self):
-        """fmt(False) should return OFF with bool_off style."""
-        result = fmt(False)
-        self.assertIn("bool_off", result)
-        self.assertIn("OFF", result)
-
-    def test_fmt_integer(self):
-        """fmt(int) should return number with num style."""
-        result = fmt(42)
-        self.assertIn("num", result)
-        self.assertIn("42", result)
+# (value, unit, substrings expected in fmt output) — one subTest matrix
+# instead of a method per case, so the per-test fixture overhead is
+# paid once rather than 17 times for near-identical assertions
+_FMT_CASES = [
+    (True, "", ("bool_on", "ON")),
+    (False, "", ("bool_off", "OFF")),
+    (42, "", ("num", "42")),
+    (3.14, "", ("num", "3.14")),
+    (100, "%", ("num", "100", "unit", "%")),
+    (1.5, "x", ("num", "1.5", "unit", "x")),
+    ("hello", "", ("str", "hello")),
+    ("on", "", ("bool_on",)),
+    ("ON", "", ("bool_on",)),
+    ("On", "", ("bool_on",)),
+    ("off", "", ("bool_off",)),
+    ("OFF", "", ("bool_off",)),
+    ("Off", "", ("bool_off",)),
+    ("true", "", ("bool_on",)),
+    ("TRUE", "", ("bool_on",)),
+    ("True", "", ("bool_on",)),
+    ("false", "", ("bool_off",)),
+    ("FALSE", "", ("bool_off",)),
+    ("False", "", ("bool_off",)),
+    ("yes", "", ("bool_on",)),
+    ("no", "", ("bool_off",)),
+    ("enabled", "", ("bool_on",)),
+    ("disabled", "", ("bool_off",)),
+    (-5, "", ("num", "-5")),
+]
 
-    def test_fmt_float(self):
-        """fmt(float) should return number with num style."""
-        result = fmt(3.14)
-        self.assertIn("num", result)
-        self.assertIn("3.14", result)
-
-    def test_fmt_integer_with_unit(self):
-        """fmt(int, unit) should include unit with unit style."""
-        result = fmt(100, "%")
-        self.assertIn("num", result)
-        self.assertIn("100", result)
-        self.assertIn("unit", result)
-        self.assertIn("%", result)
 
-    def test_fmt_float_with_unit(self):
-        """fmt(float, unit) should include unit with unit style."""
-        result = fmt(1.5, "x")
-        self.assertIn("num", result)
-        self.assertIn("1.5", result)
-        self.assertIn("unit", result)
-        self.assertIn("x", result)
+class TestFmt(unittest.TestCase):
+    """Tests for fmt() formatting function."""
 
-    def test_fmt_string(self):
-        """fmt(str) should return string with str style."""
-        result = fmt("hello")
-        self.assertIn("str", result)
-        self.assertIn("hello", result)
-
-    def test_fmt_string_on(self):
-        """fmt('on') should be styled as bool_on."""
-        for value in ["on", "ON", "On"]:
-            result = fmt(value)
-            self.assertIn("bool_on", result, f"'{value}' should use bool_on style")
-
-    def test_fmt_string_off(self):
-        """fmt('off') should be styled as bool_off."""
-        for value in ["off", "OFF", "Off"]:
-            result = fmt(value)
-            self.assertIn("bool_off", result, f"'{value}' should use bool_off style")
-
-    def test_fmt_string_true(self):
-        """fmt('true') should be styled as bool_on."""
-        for value in ["true", "TRUE", "True"]:
-            result = fmt(value)
-            self.assertIn("bool_on", result, f"'{value}' should use bool_on style")
-
-    def test_fmt_string_false(self):
-        """fmt('false') should be styled as bool_off."""
-        for value in ["false", "FALSE", "False"]:
-            result = fmt(value)
-            self.assertIn("bool_off", result, f"'{value}' should use bool_off style")
-
-    def test_fmt_string_yes(self):
-        """fmt('yes') should be styled as bool_on."""
-        result = fmt("yes")
-        self.assertIn("bool_on", result)
-
-    def test_fmt_string_no(self):
-        """fmt('no') should be styled as bool_off."""
-        result = fmt("no")
-        self.assertIn("bool_off", result)
-
-    def test_fmt_string_enabled(self):
-        """fmt('enabled') should be styled as bool_on."""
-        result = fmt("enabled")
-        self.assertIn("bool_on", result)
-
-    def test_fmt_string_disabled(self):
-        """fmt('disabled') should be styled as bool_off."""
-        result = fmt("disabled")
-        self.assertIn("bool_off", result)
+    def test_fmt_matrix(self):
+        """fmt() should style every value type per the case table."""
+        for value, unit, expected in _FMT_CASES:
+            with self.subTest(value=value, unit=unit):
+                result = fmt(value, unit) if unit else fmt(value)
+                for substring in expected:
+                    self.assertIn(substring, result)
 
     def test_fmt_zero(self):
         """fmt(0) should format as number, not bool."""
@@ -145,12 +93,6 @@ class TestFmt(unittest.TestCase):
         self.assertIn("0", result)
         self.assertNotIn("bool", result)
 
-    def test_fmt_negative_number(self):
-        """fmt(-5) should format negative numbers correctly."""
-        result = fmt(-5)
-        self.assertIn("num", result)
-        self.assertIn("-5", result)
-
 
 class TestCreateTable(unittest.TestCase):
     """Tests for create_table() function."""
@@ -223,20 +165,18 @@ class TestPrintFunctions(unittest.TestCase):
     """Tests for print_* output functions.
 
     These tests verify that functions execute without error and produce output.
-    We capture output using a StringIO buffer.
+    We capture output with Rich's console.capture().
     """
 
     def _capture_output(self, func, *args, **kwargs):
-        """Helper to capture console output."""
-        buffer = StringIO()
-        # Patch the module's console file to capture output
-        original_file = console.file
-        console._file = buffer
-        try:
+        """Helper to capture console output.
+
+        console.capture() reuses the pre-initialized module console
+        instead of swapping its private _file per test.
+        """
+        with console.capture() as capture:
             func(*args, **kwargs)
-            return buffer.getvalue()
-        finally:
-            console._file = original_file
+        return capture.get()
 
     def test_print_header_executes(self):
         """print_header() should execute without error."""